@@ -1,58 +1,54 @@
 """Order aggregate root representing a customer order."""
 
-from dataclasses import dataclass
-from datetime import datetime
-from enum import Enum
-from typing import Optional
+import time
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+from typing import Optional, Sequence
 
+from src.domain.validation import required_text
 from src.domain.value_objects.address import Address
+from src.domain.value_objects.identifiers import OrderId, ProductId, UserId
 from src.domain.value_objects.money import Money
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-class OrderStatus(Enum):
-    """Order status enumeration."""
-
-    PENDING = "pending"
-    CONFIRMED = "confirmed"
-    SHIPPED = "shipped"
-    DELIVERED = "delivered"
-    CANCELLED = "cancelled"
-
-
-@dataclass(frozen=True)
-class OrderId:
-    """Order ID value object."""
-
-    value: str
-
-    def __str__(self) -> str:
-        """String representation."""
-        return self.value
-
-
-@dataclass(frozen=True)
-class UserId:
-    """User ID value object."""
-
-    value: str
-
-    def __str__(self) -> str:
-        """String representation."""
-        return self.value
 
+def _order_currency(
+    items: Sequence["OrderItem"], shipping_cost: Money, tax_amount: Money
+) -> str:
+    """Get the single currency shared by an order's amounts.
+    
+    Args:
+        items: Order items
+        shipping_cost: Shipping cost
+        tax_amount: Tax amount
+        
+    Returns:
+        Currency code of the order
+        
+    Raises:
+        ValueError: If any amount is in a different currency
+    """
+    currency = shipping_cost.currency
+    for money in (*(item.unit_price for item in items), tax_amount):
+        if money.currency != currency:
+            raise ValueError(f"Cannot add {currency} and {money.currency}")
+    return currency
 
-@dataclass(frozen=True)
-class ProductId:
-    """Product ID value object."""
 
-    value: str
+class OrderStatus(IntEnum):
+    """Order status enumeration.
+    
+    Values follow the order lifecycle so statuses compare as plain ints.
+    """
 
-    def __str__(self) -> str:
-        """String representation."""
-        return self.value
+    PENDING = 0
+    CONFIRMED = 1
+    SHIPPED = 2
+    DELIVERED = 3
+    CANCELLED = 4
 
 
-@dataclass(frozen=True)
 class OrderItem:
     """Order item value object (immutable snapshot).
     
@@ -60,17 +56,58 @@ class OrderItem:
     of order creation. They cannot be modified after order creation.
     """
 
-    product_id: ProductId
-    product_name: str
-    quantity: int
-    unit_price: Money
+    __slots__ = ("_product_id", "_product_name", "_quantity", "_unit_price", "_hash")
 
-    def __post_init__(self) -> None:
-        """Validate order item after initialization."""
-        if self.quantity <= 0:
+    def __init__(
+        self,
+        product_id: ProductId,
+        product_name: str,
+        quantity: int,
+        unit_price: Money,
+    ) -> None:
+        """Initialize order item.
+        
+        Args:
+            product_id: Product identifier
+            product_name: Product name at time of order
+            quantity: Quantity ordered
+            unit_price: Price per unit at time of order
+            
+        Raises:
+            ValueError: If quantity is not positive or name is empty
+        """
+        if quantity <= 0:
             raise ValueError("Order item quantity must be positive")
-        if not self.product_name or not self.product_name.strip():
-            raise ValueError("Product name is required")
+        required_text(product_name, "Product name")
+        # __setattr__ rejects all writes, so fill the slots directly
+        object.__setattr__(self, "_product_id", product_id)
+        object.__setattr__(self, "_product_name", product_name)
+        object.__setattr__(self, "_quantity", quantity)
+        object.__setattr__(self, "_unit_price", unit_price)
+        # Fields are read-only, so the hash can be computed once
+        object.__setattr__(
+            self, "_hash", hash((product_id, product_name, quantity, unit_price))
+        )
+
+    @property
+    def product_id(self) -> ProductId:
+        """Get product identifier."""
+        return self._product_id
+
+    @property
+    def product_name(self) -> str:
+        """Get product name."""
+        return self._product_name
+
+    @property
+    def quantity(self) -> int:
+        """Get quantity ordered."""
+        return self._quantity
+
+    @property
+    def unit_price(self) -> Money:
+        """Get unit price."""
+        return self._unit_price
 
     @property
     def subtotal(self) -> Money:
@@ -79,27 +116,48 @@ class OrderItem:
         Returns:
             Subtotal (quantity * unit_price)
         """
-        return self.unit_price.multiply(self.quantity)
+        return self._unit_price.multiply(self._quantity)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject setting fields after construction.
+        
+        Raises:
+            AttributeError: Always
+        """
+        raise AttributeError(f"OrderItem is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject deleting fields.
+        
+        Raises:
+            AttributeError: Always
+        """
+        raise AttributeError(f"OrderItem is immutable; cannot delete {name!r}")
 
     def __eq__(self, other: object) -> bool:
         """Equality comparison by value."""
+        if self is other:
+            return True
         if not isinstance(other, OrderItem):
             return False
         return (
-            self.product_id == other.product_id
-            and self.product_name == other.product_name
-            and self.quantity == other.quantity
-            and self.unit_price == other.unit_price
+            self._product_id == other._product_id
+            and self._product_name == other._product_name
+            and self._quantity == other._quantity
+            and self._unit_price == other._unit_price
         )
 
     def __hash__(self) -> int:
         """Hash based on all fields."""
-        return hash((
-            self.product_id,
-            self.product_name,
-            self.quantity,
-            self.unit_price,
-        ))
+        return self._hash
+
+    def __repr__(self) -> str:
+        """Developer representation."""
+        return (
+            f"OrderItem(product_id={self._product_id!r}, "
+            f"product_name={self._product_name!r}, "
+            f"quantity={self._quantity!r}, unit_price={self._unit_price!r})"
+        )
 
 
 class Order:
@@ -115,6 +173,22 @@ class Order:
     - Order status transitions follow: PENDING -> CONFIRMED -> SHIPPED -> DELIVERED
     """
 
+    __slots__ = (
+        "_id",
+        "_customer_id",
+        "_shipping_address",
+        "_billing_address",
+        "_items",
+        "_shipping_cost",
+        "_tax_amount",
+        "_status",
+        "_order_date_ns",
+        "_tracking_number",
+        "_items_subtotal",
+        "_total",
+        "_repr_base",
+    )
+
     def __init__(
         self,
         order_id: OrderId,
@@ -137,7 +211,8 @@ class Order:
             tax_amount: Tax amount
             
         Raises:
-            ValueError: If order is invalid (no items, invalid total)
+            ValueError: If order has no items, or its amounts are not all
+                in one currency
         """
         if not items:
             raise ValueError("Order must contain at least one item")
@@ -146,32 +221,27 @@ class Order:
         self._customer_id = customer_id
         self._shipping_address = shipping_address
         self._billing_address = billing_address
-        self._items = items.copy()  # Defensive copy
+        self._items: tuple[OrderItem, ...] = tuple(items)  # Immutable snapshot
         self._shipping_cost = shipping_cost
         self._tax_amount = tax_amount
         self._status = OrderStatus.PENDING
-        self._order_date = datetime.utcnow()
+        # Stored as epoch nanoseconds; the datetime is built on demand
+        self._order_date_ns = time.time_ns()
         self._tracking_number: Optional[str] = None
-        
-        # Validate order total
-        self._validate_order_total()
-
-    def _validate_order_total(self) -> None:
-        """Validate that order total matches items plus shipping and tax."""
-        items_subtotal = sum(
-            item.subtotal.amount for item in self._items
+        self._repr_base = f"Order(id={order_id}, customer_id={customer_id}, "
+
+        # Items are immutable, so the sums are computed exactly once; the
+        # total is derived here, so it always matches its parts
+        currency = _order_currency(self._items, shipping_cost, tax_amount)
+        self._items_subtotal = Money.from_units(sum(
+            item.unit_price.units * item.quantity for item in self._items
+        ), currency)
+        self._total = Money.from_units(
+            self._items_subtotal.units
+            + shipping_cost.units
+            + tax_amount.units,
+            currency,
         )
-        expected_total = (
-            items_subtotal
-            + self._shipping_cost.amount
-            + self._tax_amount.amount
-        )
-        # Allow small floating point differences
-        if abs(self.total.amount - expected_total) > 0.01:
-            raise ValueError(
-                f"Order total mismatch: expected {expected_total}, "
-                f"got {self.total.amount}"
-            )
 
     @property
     def id(self) -> OrderId:
@@ -210,13 +280,13 @@ class Order:
         return self._billing_address
 
     @property
-    def items(self) -> list[OrderItem]:
-        """Get order items (defensive copy).
+    def items(self) -> tuple[OrderItem, ...]:
+        """Get order items.
         
         Returns:
-            Copy of order items list
+            Immutable tuple of order items
         """
-        return self._items.copy()
+        return self._items
 
     @property
     def status(self) -> OrderStatus:
@@ -232,9 +302,18 @@ class Order:
         """Get order date.
         
         Returns:
-            Order creation datetime
+            Order creation datetime (UTC)
         """
-        return self._order_date
+        return _EPOCH + timedelta(microseconds=self._order_date_ns // 1000)
+
+    @property
+    def order_date_ns(self) -> int:
+        """Get order date as nanoseconds since the Unix epoch.
+        
+        Returns:
+            Order creation time, suitable for storage without conversion
+        """
+        return self._order_date_ns
 
     @property
     def tracking_number(self) -> Optional[str]:
@@ -247,28 +326,21 @@ class Order:
 
     @property
     def items_subtotal(self) -> Money:
-        """Calculate items subtotal.
+        """Get items subtotal.
         
         Returns:
             Sum of all order items
         """
-        total = Money(0)
-        for item in self._items:
-            total = total.add(item.subtotal)
-        return total
+        return self._items_subtotal
 
     @property
     def total(self) -> Money:
-        """Calculate order total.
+        """Get order total.
         
         Returns:
             Total (items + shipping + tax)
         """
-        return (
-            self.items_subtotal
-            .add(self._shipping_cost)
-            .add(self._tax_amount)
-        )
+        return self._total
 
     def confirm(self) -> None:
         """Confirm the order (payment received).
@@ -278,7 +350,7 @@ class Order:
         """
         if self._status != OrderStatus.PENDING:
             raise ValueError(
-                f"Cannot confirm order in {self._status.value} status"
+                f"Cannot confirm order in {self._status.name.lower()} status"
             )
         self._status = OrderStatus.CONFIRMED
 
@@ -293,7 +365,7 @@ class Order:
         """
         if self._status != OrderStatus.CONFIRMED:
             raise ValueError(
-                f"Cannot ship order in {self._status.value} status"
+                f"Cannot ship order in {self._status.name.lower()} status"
             )
         if not tracking_number or not tracking_number.strip():
             raise ValueError("Tracking number is required")
@@ -309,7 +381,7 @@ class Order:
         """
         if self._status != OrderStatus.SHIPPED:
             raise ValueError(
-                f"Cannot mark order as delivered in {self._status.value} status"
+                f"Cannot mark order as delivered in {self._status.name.lower()} status"
             )
         self._status = OrderStatus.DELIVERED
 
@@ -319,9 +391,10 @@ class Order:
         Raises:
             ValueError: If order cannot be cancelled
         """
-        if self._status in (OrderStatus.SHIPPED, OrderStatus.DELIVERED):
+        # SHIPPED and DELIVERED are adjacent in the lifecycle ordering
+        if OrderStatus.SHIPPED <= self._status <= OrderStatus.DELIVERED:
             raise ValueError(
-                f"Cannot cancel order in {self._status.value} status"
+                f"Cannot cancel order in {self._status.name.lower()} status"
             )
         self._status = OrderStatus.CANCELLED
 
@@ -334,6 +407,8 @@ class Order:
         Returns:
             True if order IDs are equal
         """
+        if self is other:
+            return True
         if not isinstance(other, Order):
             return False
         return self._id == other._id
@@ -353,6 +428,54 @@ class Order:
             Developer-friendly string representation
         """
         return (
-            f"Order(id={self._id}, customer_id={self._customer_id}, "
-            f"status={self._status.value}, total={self.total})"
+            f"{self._repr_base}"
+            f"status={self._status.name.lower()}, total={self._total})"
+        )
+
+
+def validate_order_totals(
+    items: Sequence[Sequence[OrderItem]],
+    shipping_costs: Sequence[Money],
+    tax_amounts: Sequence[Money],
+    totals: Sequence[Money],
+) -> list[bool]:
+    """Validate recorded totals for a batch of orders.
+    
+    Intended for bulk imports where each legacy order carries a stated
+    total. Inputs are parallel sequences (one entry per order), so totals
+    can be checked without building an Order aggregate or any
+    intermediate Money objects.
+    
+    Args:
+        items: Order items for each order
+        shipping_costs: Shipping cost for each order
+        tax_amounts: Tax amount for each order
+        totals: Recorded total for each order
+        
+    Returns:
+        One flag per order, True if its total matches items plus
+        shipping and tax
+        
+    Raises:
+        ValueError: If the sequences differ in length, or an order's
+            items, shipping and tax are not all in one currency
+    """
+    if not (len(items) == len(shipping_costs) == len(tax_amounts) == len(totals)):
+        raise ValueError("Order batch sequences must have the same length")
+    
+    results = []
+    for order_items, shipping_cost, tax_amount, total in zip(
+        items, shipping_costs, tax_amounts, totals, strict=True
+    ):
+        currency = _order_currency(order_items, shipping_cost, tax_amount)
+        expected_units = (
+            sum(item.unit_price.units * item.quantity for item in order_items)
+            + shipping_cost.units
+            + tax_amount.units
+        )
+        # Allow a one-cent rounding difference, as Order does; a total in
+        # another currency never matches
+        results.append(
+            total.currency == currency and abs(total.units - expected_units) <= 1
         )
+    return results
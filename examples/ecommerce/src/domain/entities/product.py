@@ -1,42 +1,23 @@
 """Product entity representing a catalog item."""
 
-from dataclasses import dataclass
-from datetime import datetime
-from enum import Enum
-from typing import Optional
-
+from array import array
+from datetime import datetime, timezone
+from enum import StrEnum
+from itertools import compress
+from typing import Iterable, Optional
+
+from src.domain.validation import required_text
+from src.domain.value_objects.identifiers import CategoryId, ProductId
 from src.domain.value_objects.money import Money
 
 
-class ProductStatus(Enum):
+class ProductStatus(StrEnum):
     """Product status enumeration."""
 
     ACTIVE = "active"
     INACTIVE = "inactive"
 
 
-@dataclass(frozen=True)
-class ProductId:
-    """Product ID value object."""
-
-    value: str
-
-    def __str__(self) -> str:
-        """String representation."""
-        return self.value
-
-
-@dataclass(frozen=True)
-class CategoryId:
-    """Category ID value object."""
-
-    value: str
-
-    def __str__(self) -> str:
-        """String representation."""
-        return self.value
-
-
 class Product:
     """Product entity representing a catalog item.
     
@@ -44,6 +25,19 @@ class Product:
     Products can be active or inactive.
     """
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_price",
+        "_sku",
+        "_stock_quantity",
+        "_status",
+        "_description",
+        "_category_ids",
+        "_created_at",
+        "_updated_at",
+    )
+
     def __init__(
         self,
         product_id: ProductId,
@@ -70,27 +64,26 @@ class Product:
         Raises:
             ValueError: If name is empty, SKU is empty, or stock is negative
         """
-        if not name or not name.strip():
-            raise ValueError("Product name is required")
+        stripped_name = required_text(name, "Product name")
         if len(name) > 200:
             raise ValueError("Product name cannot exceed 200 characters")
-        if not sku or not sku.strip():
-            raise ValueError("SKU is required")
+        stripped_sku = required_text(sku, "SKU")
         if stock_quantity < 0:
             raise ValueError("Stock quantity cannot be negative")
         if description and len(description) > 2000:
             raise ValueError("Description cannot exceed 2000 characters")
         
         self._id = product_id
-        self._name = name.strip()
+        self._name = stripped_name
         self._price = price
-        self._sku = sku.strip()
+        self._sku = stripped_sku
         self._stock_quantity = stock_quantity
         self._status = status
         self._description = description.strip() if description else None
-        self._category_ids = category_ids or []
-        self._created_at = datetime.utcnow()
-        self._updated_at = datetime.utcnow()
+        self._category_ids: tuple[CategoryId, ...] = (
+            tuple(category_ids) if category_ids else ()
+        )
+        self._created_at = self._updated_at = datetime.now(timezone.utc)
 
     @property
     def id(self) -> ProductId:
@@ -156,13 +149,13 @@ class Product:
         return self._description
 
     @property
-    def category_ids(self) -> list[CategoryId]:
+    def category_ids(self) -> tuple[CategoryId, ...]:
         """Get category IDs.
         
         Returns:
-            List of category IDs
+            Immutable tuple of category IDs
         """
-        return self._category_ids.copy()
+        return self._category_ids
 
     @property
     def created_at(self) -> datetime:
@@ -182,20 +175,28 @@ class Product:
         """
         return self._updated_at
 
-    def update_price(self, new_price: Money) -> None:
+    def update_price(
+        self, new_price: Money, now: Optional[datetime] = None
+    ) -> None:
         """Update product price.
         
         Args:
             new_price: New price to set
+            now: Update timestamp; pass one value to stamp a batch of
+                updates consistently (default: current UTC time)
         """
         self._price = new_price
-        self._updated_at = datetime.utcnow()
+        self._updated_at = now or datetime.now(timezone.utc)
 
-    def update_stock(self, new_quantity: int) -> None:
+    def update_stock(
+        self, new_quantity: int, now: Optional[datetime] = None
+    ) -> None:
         """Update stock quantity.
         
         Args:
             new_quantity: New stock quantity
+            now: Update timestamp; pass one value to stamp a batch of
+                updates consistently (default: current UTC time)
             
         Raises:
             ValueError: If quantity is negative
@@ -203,13 +204,17 @@ class Product:
         if new_quantity < 0:
             raise ValueError("Stock quantity cannot be negative")
         self._stock_quantity = new_quantity
-        self._updated_at = datetime.utcnow()
+        self._updated_at = now or datetime.now(timezone.utc)
 
-    def decrease_stock(self, quantity: int) -> None:
+    def decrease_stock(
+        self, quantity: int, now: Optional[datetime] = None
+    ) -> None:
         """Decrease stock quantity.
         
         Args:
             quantity: Quantity to decrease
+            now: Update timestamp; pass one value to stamp a batch of
+                updates consistently (default: current UTC time)
             
         Raises:
             ValueError: If quantity is negative or exceeds available stock
@@ -220,17 +225,27 @@ class Product:
             raise ValueError("Insufficient stock")
         
         self._stock_quantity -= quantity
-        self._updated_at = datetime.utcnow()
+        self._updated_at = now or datetime.now(timezone.utc)
 
-    def activate(self) -> None:
-        """Activate the product."""
+    def activate(self, now: Optional[datetime] = None) -> None:
+        """Activate the product.
+        
+        Args:
+            now: Update timestamp; pass one value to stamp a batch of
+                updates consistently (default: current UTC time)
+        """
         self._status = ProductStatus.ACTIVE
-        self._updated_at = datetime.utcnow()
+        self._updated_at = now or datetime.now(timezone.utc)
 
-    def deactivate(self) -> None:
-        """Deactivate the product."""
+    def deactivate(self, now: Optional[datetime] = None) -> None:
+        """Deactivate the product.
+        
+        Args:
+            now: Update timestamp; pass one value to stamp a batch of
+                updates consistently (default: current UTC time)
+        """
         self._status = ProductStatus.INACTIVE
-        self._updated_at = datetime.utcnow()
+        self._updated_at = now or datetime.now(timezone.utc)
 
     def is_available(self) -> bool:
         """Check if product is available for purchase.
@@ -252,6 +267,8 @@ class Product:
         Returns:
             True if product IDs are equal
         """
+        if self is other:
+            return True
         if not isinstance(other, Product):
             return False
         return self._id == other._id
@@ -274,3 +291,82 @@ class Product:
             f"Product(id={self._id}, name='{self._name}', "
             f"price={self._price}, stock={self._stock_quantity})"
         )
+
+
+class CatalogView:
+    """Column-oriented read model for bulk catalog queries.
+    
+    Keeps price, stock and status of many products in parallel arrays so
+    listing filters scan compact columns instead of calling methods on
+    every Product. Products remain the source of truth: call refresh()
+    after mutating a product to resync its row. Prices are compared in
+    cents and assume a single-currency catalog.
+    """
+
+    __slots__ = ("_ids", "_rows", "_price_cents", "_stock", "_active")
+
+    def __init__(self, products: Iterable[Product] = ()) -> None:
+        """Initialize catalog view.
+        
+        Args:
+            products: Products to index
+        """
+        self._ids: list[ProductId] = []
+        self._rows: dict[ProductId, int] = {}
+        self._price_cents = array("q")
+        self._stock = array("q")
+        self._active = bytearray()
+        for product in products:
+            self.refresh(product)
+
+    def refresh(self, product: Product) -> None:
+        """Add a product or resync its row after a mutation.
+        
+        Args:
+            product: Product to index
+        """
+        price_cents = product.price.units
+        active = product.status == ProductStatus.ACTIVE
+        row = self._rows.get(product.id)
+        if row is None:
+            self._rows[product.id] = len(self._ids)
+            self._ids.append(product.id)
+            self._price_cents.append(price_cents)
+            self._stock.append(product.stock_quantity)
+            self._active.append(active)
+        else:
+            self._price_cents[row] = price_cents
+            self._stock[row] = product.stock_quantity
+            self._active[row] = active
+
+    def available_ids(self) -> list[ProductId]:
+        """Get IDs of products that are active and in stock.
+        
+        Returns:
+            List of product IDs, in indexing order
+        """
+        return list(compress(
+            self._ids,
+            (a and s > 0 for a, s in zip(self._active, self._stock)),
+        ))
+
+    def price_between(self, low: Money, high: Money) -> list[ProductId]:
+        """Get IDs of products priced within a range.
+        
+        Args:
+            low: Minimum price (inclusive)
+            high: Maximum price (inclusive)
+            
+        Returns:
+            List of product IDs, in indexing order
+        """
+        low_cents = low.units
+        high_cents = high.units
+        return list(compress(
+            self._ids,
+            (low_cents <= p <= high_cents for p in self._price_cents),
+        ))
+
+    def __len__(self) -> int:
+        """Number of indexed products."""
+        return len(self._ids)
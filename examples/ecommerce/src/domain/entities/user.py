@@ -1,13 +1,14 @@
 """User entity representing a customer or admin user."""
 
-from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 
+from src.domain.validation import required_text
 from src.domain.value_objects.email import Email
+from src.domain.value_objects.identifiers import UserId
 
 
-class UserRole(Enum):
+class UserRole(StrEnum):
     """User role enumeration."""
 
     CUSTOMER = "customer"
@@ -15,17 +16,6 @@ class UserRole(Enum):
     VENDOR = "vendor"
 
 
-@dataclass(frozen=True)
-class UserId:
-    """User ID value object."""
-
-    value: str
-
-    def __str__(self) -> str:
-        """String representation."""
-        return self.value
-
-
 class User:
     """User entity representing a registered user.
     
@@ -33,6 +23,16 @@ class User:
     a unique identity and can have a profile with personal information.
     """
 
+    __slots__ = (
+        "_id",
+        "_email",
+        "_password_hash",
+        "_role",
+        "_first_name",
+        "_last_name",
+        "_phone_number",
+    )
+
     def __init__(
         self,
         user_id: UserId,
@@ -51,12 +51,9 @@ class User:
         Raises:
             ValueError: If password hash is empty
         """
-        if not password_hash or not password_hash.strip():
-            raise ValueError("Password hash is required")
-        
         self._id = user_id
         self._email = email
-        self._password_hash = password_hash.strip()
+        self._password_hash = required_text(password_hash, "Password hash")
         self._role = role
         self._first_name: Optional[str] = None
         self._last_name: Optional[str] = None
@@ -157,6 +154,8 @@ class User:
         Returns:
             True if user IDs are equal
         """
+        if self is other:
+            return True
         if not isinstance(other, User):
             return False
         return self._id == other._id
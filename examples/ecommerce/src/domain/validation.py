@@ -0,0 +1,20 @@
+"""Validation helpers shared by e-commerce domain objects."""
+
+
+def required_text(value: str, field: str) -> str:
+    """Strip a required text field and ensure it is not blank.
+
+    Args:
+        value: Raw input string
+        field: Human-readable field name used in the error message
+
+    Returns:
+        Stripped string
+
+    Raises:
+        ValueError: If value is empty or whitespace only
+    """
+    stripped = value.strip() if value else ""
+    if not stripped:
+        raise ValueError(f"{field} is required")
+    return stripped
@@ -1,6 +1,9 @@
 """Address value object for shipping and billing addresses."""
 
-from typing import Self
+from typing import ClassVar, Self
+from weakref import WeakValueDictionary
+
+from src.domain.validation import required_text
 
 
 class Address:
@@ -10,6 +13,20 @@ class Address:
     Used for both shipping and billing addresses.
     """
 
+    __slots__ = (
+        "_street",
+        "_city",
+        "_state",
+        "_postal_code",
+        "_country",
+        "_str",
+        "_hash",
+        "__weakref__",
+    )
+
+    # Canonical instances handed out by Address.of(), keyed by raw fields
+    _pool: ClassVar[WeakValueDictionary] = WeakValueDictionary()
+
     def __init__(
         self,
         street: str,
@@ -30,22 +47,59 @@ class Address:
         Raises:
             ValueError: If any required field is empty
         """
-        if not street or not street.strip():
-            raise ValueError("Street address is required")
-        if not city or not city.strip():
-            raise ValueError("City is required")
-        if not state or not state.strip():
-            raise ValueError("State is required")
-        if not postal_code or not postal_code.strip():
-            raise ValueError("Postal code is required")
-        if not country or not country.strip():
-            raise ValueError("Country is required")
+        self._street = required_text(street, "Street address")
+        self._city = required_text(city, "City")
+        self._state = required_text(state, "State")
+        self._postal_code = required_text(postal_code, "Postal code")
+        self._country = required_text(country, "Country")
         
-        self._street = street.strip()
-        self._city = city.strip()
-        self._state = state.strip()
-        self._postal_code = postal_code.strip()
-        self._country = country.strip()
+        # Fields are immutable, so the formatted string and hash are fixed
+        self._str = (
+            f"{self._street}, {self._city}, {self._state} "
+            f"{self._postal_code}, {self._country}"
+        )
+        self._hash = hash((
+            self._street,
+            self._city,
+            self._state,
+            self._postal_code,
+            self._country,
+        ))
+
+    @classmethod
+    def of(
+        cls,
+        street: str,
+        city: str,
+        state: str,
+        postal_code: str,
+        country: str,
+    ) -> Self:
+        """Get the canonical address instance for the given fields.
+        
+        Customers reuse the same addresses across many orders; this
+        returns a shared instance while any reference to it is alive
+        instead of building a new object each time.
+        
+        Args:
+            street: Street address
+            city: City name
+            state: State or province
+            postal_code: Postal or ZIP code
+            country: Country code or name
+            
+        Returns:
+            Shared address value object
+            
+        Raises:
+            ValueError: If any required field is empty
+        """
+        key = (street, city, state, postal_code, country)
+        address = cls._pool.get(key)
+        if address is None:
+            address = cls(*key)
+            cls._pool[key] = address
+        return address
 
     @property
     def street(self) -> str:
@@ -101,6 +155,8 @@ class Address:
         Returns:
             True if all address fields are equal
         """
+        if self is other:
+            return True
         if not isinstance(other, Address):
             return False
         return (
@@ -117,13 +173,7 @@ class Address:
         Returns:
             Hash value
         """
-        return hash((
-            self._street,
-            self._city,
-            self._state,
-            self._postal_code,
-            self._country,
-        ))
+        return self._hash
 
     def __str__(self) -> str:
         """String representation.
@@ -131,10 +181,7 @@ class Address:
         Returns:
             Formatted address string
         """
-        return (
-            f"{self._street}, {self._city}, {self._state} "
-            f"{self._postal_code}, {self._country}"
-        )
+        return self._str
 
     def __repr__(self) -> str:
         """Developer representation.
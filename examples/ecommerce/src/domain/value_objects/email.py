@@ -12,9 +12,11 @@ class Email:
     immutable once created.
     """
 
-    # Basic email regex pattern (RFC 5322 compliant)
+    __slots__ = ("_value", "_hash")
+
+    # Basic email regex pattern (RFC 5322 compliant), used with fullmatch
     EMAIL_PATTERN = re.compile(
-        r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
     )
 
     def __init__(self, value: str) -> None:
@@ -31,10 +33,12 @@ class Email:
         
         value = value.strip().lower()
         
-        if not self.EMAIL_PATTERN.match(value):
+        # Cheap rejection before running the regex engine
+        if "@" not in value or not self.EMAIL_PATTERN.fullmatch(value):
             raise ValueError(f"Invalid email format: {value}")
         
         self._value = value
+        self._hash = hash(value)
 
     @property
     def value(self) -> str:
@@ -54,6 +58,8 @@ class Email:
         Returns:
             True if emails are equal, False otherwise
         """
+        if self is other:
+            return True
         if not isinstance(other, Email):
             return False
         return self._value == other._value
@@ -64,7 +70,7 @@ class Email:
         Returns:
             Hash of email value
         """
-        return hash(self._value)
+        return self._hash
 
     def __str__(self) -> str:
         """String representation.
@@ -0,0 +1,81 @@
+"""Identifier value objects shared across the e-commerce domain."""
+
+
+class _StrId:
+    """Base for string-backed identifier value objects.
+
+    Identifiers are immutable and compare equal only to identifiers of
+    the same type carrying the same value.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: str) -> None:
+        """Initialize identifier.
+
+        Args:
+            value: Identifier string
+        """
+        self._value = value
+
+    @property
+    def value(self) -> str:
+        """Get the identifier value.
+
+        Returns:
+            Identifier string
+        """
+        return self._value
+
+    def __eq__(self, other: object) -> bool:
+        """Equality comparison by type and value.
+
+        Args:
+            other: Other object to compare
+
+        Returns:
+            True if both identifiers have the same type and value
+        """
+        if type(other) is not type(self):
+            return False
+        return self._value == other._value
+
+    def __hash__(self) -> int:
+        """Hash based on identifier value.
+
+        Returns:
+            Hash of identifier value
+        """
+        return hash(self._value)
+
+    def __str__(self) -> str:
+        """String representation."""
+        return self._value
+
+    def __repr__(self) -> str:
+        """Developer representation."""
+        return f"{type(self).__name__}(value={self._value!r})"
+
+
+class OrderId(_StrId):
+    """Order ID value object."""
+
+    __slots__ = ()
+
+
+class UserId(_StrId):
+    """User ID value object."""
+
+    __slots__ = ()
+
+
+class ProductId(_StrId):
+    """Product ID value object."""
+
+    __slots__ = ()
+
+
+class CategoryId(_StrId):
+    """Category ID value object."""
+
+    __slots__ = ()
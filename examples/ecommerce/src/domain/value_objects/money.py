@@ -1,49 +1,196 @@
 """Money value object for currency amounts."""
 
-from decimal import Decimal
-from typing import Self
+import sys
+from decimal import ROUND_HALF_EVEN, Decimal
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, Self
+
+_CENT = Decimal("0.01")
+_ROUND = ROUND_HALF_EVEN
+
+
+@lru_cache(maxsize=1024)
+def _float_to_decimal(value: float) -> Decimal:
+    """Convert a float to the Decimal of its shortest repr.
+    
+    Prices repeat heavily (9.99, 19.99, ...), so conversions are cached.
+    
+    Args:
+        value: Float amount
+        
+    Returns:
+        Decimal equal to str(value)
+    """
+    return Decimal(str(value))
+
+
+# Raw currency code -> interned upper-case code. Bounded so arbitrary
+# user input can't grow it without limit.
+_CURRENCY_CACHE: dict[str, str] = {}
+_CURRENCY_CACHE_SIZE = 256
+
+
+def _canonical_currency(code: str) -> str:
+    """Get the interned upper-case form of a currency code.
+    
+    Args:
+        code: Currency code as given by the caller
+        
+    Returns:
+        Canonical currency code; equal codes share one string object
+    """
+    canonical = _CURRENCY_CACHE.get(code)
+    if canonical is None:
+        canonical = sys.intern(code.upper())
+        if len(_CURRENCY_CACHE) < _CURRENCY_CACHE_SIZE:
+            _CURRENCY_CACHE[code] = canonical
+    return canonical
+
+
+# Amount parsers keyed by exact input type, so construction does one dict
+# lookup instead of walking an isinstance chain
+_CONVERTERS: dict[type, Callable[[Any], Decimal]] = {
+    Decimal: lambda value: value,
+    str: Decimal,
+    float: _float_to_decimal,
+    int: Decimal,
+}
 
 
 class Money:
     """Money value object representing a currency amount.
     
     Money is immutable and ensures amounts are always positive.
-    Uses Decimal for precise decimal arithmetic.
+    Amounts are stored as an integer number of cents so arithmetic stays
+    in plain ints; Decimal is only used at the construction boundary and
+    for the ``amount`` view.
     """
 
-    def __init__(self, amount: Decimal | float | str, currency: str = "USD") -> None:
+    __slots__ = ("_units", "_currency", "_amount", "_hash")
+
+    def __init__(self, amount: Decimal | int | float | str, currency: str = "USD") -> None:
         """Initialize money value object.
         
         Args:
-            amount: Monetary amount (Decimal, float, or string)
+            amount: Monetary amount (Decimal, int, float, or string)
             currency: Currency code (default: USD)
             
         Raises:
             ValueError: If amount is negative or invalid
         """
-        if isinstance(amount, str):
-            amount = Decimal(amount)
-        elif isinstance(amount, float):
-            amount = Decimal(str(amount))
-        elif not isinstance(amount, Decimal):
-            raise ValueError("Amount must be Decimal, float, or string")
-        
-        if amount < 0:
+        self._amount: Optional[Decimal]
+        amount_type = type(amount)
+        if amount_type is int:
+            # Whole amounts need no rounding
+            if amount < 0:
+                raise ValueError("Money amount cannot be negative")
+            self._units = amount * 100
+            self._amount = None
+        else:
+            convert = _CONVERTERS.get(amount_type)
+            if convert is None and amount_type is not bool:
+                # Subclasses of the supported types take the slow path; bool
+                # subclasses int but is not an amount
+                convert = next(
+                    (c for t, c in _CONVERTERS.items() if isinstance(amount, t)),
+                    None,
+                )
+            if convert is None:
+                raise ValueError("Amount must be Decimal, int, float, or string")
+            amount = convert(amount)
+            
+            if amount < 0:
+                raise ValueError("Money amount cannot be negative")
+            
+            # Round to whole cents for currency
+            quantized = amount.quantize(_CENT, rounding=_ROUND)
+            self._units = int(quantized.scaleb(2))
+            self._amount = quantized
+        # Interned so equal currencies usually share one string object
+        self._currency = _canonical_currency(currency)
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def from_units(cls, units: int, currency: str = "USD") -> Self:
+        """Create Money from an integer number of cents.
+        
+        Args:
+            units: Amount in cents
+            currency: Currency code (default: USD)
+            
+        Returns:
+            New Money object
+            
+        Raises:
+            ValueError: If units is negative
+        """
+        if units < 0:
             raise ValueError("Money amount cannot be negative")
+        return cls._from_units(units, _canonical_currency(currency))
+
+    @classmethod
+    def sum(cls, items: Iterable["Money"], currency: str = "USD") -> Self:
+        """Add up many money amounts in one pass.
+        
+        Cents are summed as plain ints and a single Money is built for the
+        result, instead of one intermediate Money per ``add`` call.
+        
+        Args:
+            items: Money objects to add up
+            currency: Currency of the result when items is empty (default: USD)
+            
+        Returns:
+            New Money object with the total
+            
+        Raises:
+            ValueError: If the items don't all share one currency
+        """
+        items = list(items)
+        if not items:
+            return cls.from_units(0, currency)
+        currencies = {item._currency for item in items}
+        if len(currencies) > 1:
+            raise ValueError(f"Cannot add {', '.join(sorted(currencies))}")
+        return cls._from_units(sum(item._units for item in items), items[0]._currency)
+
+    @classmethod
+    def _from_units(cls, units: int, currency: str) -> Self:
+        """Build Money from already-normalized cents, skipping validation.
         
-        # Round to 2 decimal places for currency
-        self._amount = amount.quantize(Decimal('0.01'))
-        self._currency = currency.upper()
+        Args:
+            units: Non-negative amount in cents
+            currency: Upper-case currency code
+            
+        Returns:
+            New Money object
+        """
+        money = object.__new__(cls)
+        money._units = units
+        money._currency = currency
+        money._amount = None
+        money._hash = None
+        return money
 
     @property
     def amount(self) -> Decimal:
         """Get the monetary amount.
         
         Returns:
-            Decimal amount
+            Decimal amount with two decimal places
         """
+        if self._amount is None:
+            self._amount = Decimal(self._units).scaleb(-2)
         return self._amount
 
+    @property
+    def units(self) -> int:
+        """Get the amount in cents.
+        
+        Returns:
+            Integer number of cents
+        """
+        return self._units
+
     @property
     def currency(self) -> str:
         """Get the currency code.
@@ -60,15 +207,47 @@ class Money:
             other: Other money object to add
             
         Returns:
-            New Money object with sum
+            Money object with sum (one of the operands if the other is zero)
             
         Raises:
             ValueError: If currencies don't match
         """
-        if self._currency != other._currency:
+        # Currency codes are interned, so the identity check usually decides
+        if self._currency is not other._currency and self._currency != other._currency:
             raise ValueError(f"Cannot add {self._currency} and {other._currency}")
         
-        return Money(self._amount + other._amount, self._currency)
+        # Money is immutable, so a zero operand can hand back the other one
+        if not self._units:
+            return other
+        if not other._units:
+            return self
+        return self._from_units(self._units + other._units, self._currency)
+
+    def __add__(self, other: object) -> Self:
+        """Add another money amount with the ``+`` operator.
+        
+        Args:
+            other: Other money object to add
+            
+        Returns:
+            Money object with sum
+        """
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.add(other)
+
+    def __radd__(self, other: object) -> Self:
+        """Support ``sum()`` over Money, whose default start value is 0.
+        
+        Args:
+            other: Left operand; only the integer 0 is accepted
+            
+        Returns:
+            This Money object
+        """
+        if isinstance(other, int) and other == 0:
+            return self
+        return NotImplemented
 
     def multiply(self, multiplier: Decimal | float | int) -> Self:
         """Multiply money by a multiplier.
@@ -78,13 +257,20 @@ class Money:
             
         Returns:
             New Money object with multiplied amount
+            
+        Raises:
+            ValueError: If the result would be negative
         """
-        if isinstance(multiplier, float):
-            multiplier = Decimal(str(multiplier))
-        elif isinstance(multiplier, int):
-            multiplier = Decimal(multiplier)
+        if isinstance(multiplier, int):
+            units = self._units * multiplier
+        else:
+            if isinstance(multiplier, float):
+                multiplier = _float_to_decimal(multiplier)
+            units = int((self._units * multiplier).to_integral_value(rounding=_ROUND))
         
-        return Money(self._amount * multiplier, self._currency)
+        if units < 0:
+            raise ValueError("Money amount cannot be negative")
+        return self._from_units(units, self._currency)
 
     def __eq__(self, other: object) -> bool:
         """Equality comparison by value.
@@ -95,9 +281,11 @@ class Money:
         Returns:
             True if amounts and currencies are equal
         """
+        if self is other:
+            return True
         if not isinstance(other, Money):
             return False
-        return self._amount == other._amount and self._currency == other._currency
+        return self._units == other._units and self._currency == other._currency
 
     def __hash__(self) -> int:
         """Hash based on amount and currency.
@@ -105,7 +293,10 @@ class Money:
         Returns:
             Hash value
         """
-        return hash((self._amount, self._currency))
+        # Computed on first use; most Money values are never hashed
+        if self._hash is None:
+            self._hash = hash((self._units, self._currency))
+        return self._hash
 
     def __str__(self) -> str:
         """String representation.
@@ -113,7 +304,7 @@ class Money:
         Returns:
             Formatted money string
         """
-        return f"{self._currency} {self._amount:.2f}"
+        return f"{self._currency} {self.amount}"
 
     def __repr__(self) -> str:
         """Developer representation.
@@ -121,4 +312,4 @@ class Money:
         Returns:
             Developer-friendly string representation
         """
-        return f"Money({self._amount}, '{self._currency}')"
+        return f"Money({self.amount}, '{self._currency}')"
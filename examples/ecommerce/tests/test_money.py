@@ -0,0 +1,21 @@
+"""Tests for the Money value object."""
+from decimal import Decimal
+
+import pytest
+
+from src.domain.value_objects.money import Money
+
+
+class TestMoney:
+    """Test cases for Money construction."""
+
+    @pytest.mark.parametrize("amount", [10, 10.0, "10", Decimal("10")])
+    def test_supported_amount_types(self, amount):
+        """Test that every supported amount type gives the same value."""
+        assert Money(amount) == Money.from_units(1000)
+
+    @pytest.mark.parametrize("amount", [True, False])
+    def test_bool_amount_is_rejected(self, amount):
+        """Test that bool is not accepted as an int amount."""
+        with pytest.raises(ValueError, match="Amount must be"):
+            Money(amount)
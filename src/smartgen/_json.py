@@ -0,0 +1,53 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install smartgen[fast]``); without it
+the stdlib json module is used.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text as str or UTF-8 bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an object to JSON.
+
+    With orjson the output is 2-space indented (orjson indents in C). The
+    stdlib fallback writes compact JSON instead, because json only uses its
+    C encoder when no indent is requested, unless pretty is set.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent the stdlib fallback output too, for text shown to users
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,45 @@
+"""YAML helpers that use the libyaml C bindings when they are available.
+
+PyYAML wheels normally ship with libyaml; builds without it fall back to
+the pure-Python safe loader and dumper.
+"""
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper, SafeLoader
+
+YAMLError = yaml.YAMLError
+
+
+def safe_load(stream: str | bytes | IO[Any]) -> Any:
+    """Parse a YAML document with the fastest available safe loader.
+
+    Args:
+        stream: YAML text, bytes or file object
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        YAMLError: If the document is not valid YAML
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: IO[str] | None = None, **kwargs: Any) -> Any:
+    """Serialize data to YAML with the fastest available safe dumper.
+
+    Args:
+        data: Object to serialize
+        stream: Optional stream to write to
+        **kwargs: Extra options passed to yaml.dump
+
+    Returns:
+        The YAML string if no stream was given, otherwise None
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
@@ -0,0 +1,6 @@
+"""Status prefixes shared by the CLI commands."""
+import typer
+
+# Styled once at import
+CHECK = typer.style("✓ ", fg=typer.colors.GREEN)
+CROSS = typer.style("✗ ", fg=typer.colors.RED)
@@ -1,69 +1,89 @@
 """Generate command for creating project artifacts."""
+import os
 from pathlib import Path
+
 import typer
-from rich import print as rich_print
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from smartgen.services.domain_generator import DomainGeneratorService, GeneratorError
-from smartgen.services.layout_generator import LayoutGeneratorService, LayoutGeneratorError
+from smartgen.commands._status import CHECK, CROSS
 
 generate_app = typer.Typer(help="Generate project artifacts")
 
 
+def _print_success_panel(message: str) -> None:
+    """Print the green "Success" panel shown after a generator finishes."""
+    from rich import print as rich_print
+    from rich.panel import Panel
+
+    rich_print(Panel.fit(message, title="Success", border_style="green"))
+
+
 @generate_app.command("domain")
 def generate_domain(
     debug: bool = typer.Option(False, "--debug", help="Enable debug mode to show all inputs/outputs")
 ) -> None:
     """Generate domain elements based on SRS and DDD policy."""
+    # Imported here so other commands (and --help) don't pay for them
+    import yaml
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from smartgen.services.domain_generator import (
+        DomainGeneratorService,
+        GeneratorError,
+    )
+
     project_dir = Path.cwd()
+    service = DomainGeneratorService(debug=debug)
+    
+    # Show progress spinner while generating
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        transient=True,
+    )
     
     try:
-        service = DomainGeneratorService(debug=debug)
-        
-        # Show progress spinner while generating
-        progress = Progress(
-            SpinnerColumn(),
-            TextColumn("{task.description}"),
-            transient=True,
-        )
-        
         with progress:
             task_id = progress.add_task("Generating domain layer...", start=True)
             result = service.generate_domain(project_dir)
             progress.update(task_id, description="Domain layer generated!")
-        
-        typer.echo(
-            typer.style("✓ ", fg=typer.colors.GREEN)
-            + f"Domain elements generated using provider '{result.provider_name}'."
-        )
-        
-        typer.echo(
-            typer.style("✓ ", fg=typer.colors.GREEN)
-            + f"Generated {len(result.generated_files)} file(s):"
-        )
-        
-        for file_path in result.generated_files:
-            typer.echo(f"  - {file_path.relative_to(project_dir)}")
-        
-        rich_print(
-            Panel.fit(
-                "Domain layer has been generated successfully.\n"
-                "Review the generated files and adjust as needed.",
-                title="Success",
-                border_style="green",
-            )
-        )
-        
     except GeneratorError as exc:
-        typer.echo(typer.style("✗ ", fg=typer.colors.RED) + str(exc), err=True)
-        raise typer.Exit(1)
+        typer.echo(CROSS + str(exc), err=True)
+        raise typer.Exit(1) from None
+    except yaml.YAMLError as exc:
+        typer.echo(CROSS + f"Invalid YAML: {exc}", err=True)
+        raise typer.Exit(1) from None
+    except OSError as exc:
+        typer.echo(CROSS + f"File system error: {exc}", err=True)
+        raise typer.Exit(1) from None
     except Exception as exc:
-        typer.echo(
-            typer.style("✗ ", fg=typer.colors.RED) + f"Unexpected error: {exc}",
-            err=True
-        )
-        raise typer.Exit(1)
+        # Keep the traceback when debugging; otherwise report it cleanly
+        if debug:
+            raise
+        typer.echo(CROSS + f"Unexpected error: {exc}", err=True)
+        raise typer.Exit(1) from None
+    
+    typer.echo(
+        CHECK
+        + f"Domain elements generated using provider '{result.provider_name}'."
+    )
+    
+    typer.echo(
+        CHECK
+        + f"Generated {len(result.generated_files)} file(s):"
+    )
+    
+    if result.generated_files:
+        # One write for the whole listing instead of one per file; relpath
+        # since LLM-chosen paths need not lie under the project directory
+        typer.echo("\n".join(
+            f"  - {os.path.relpath(file_path, project_dir)}"
+            for file_path in result.generated_files
+        ))
+    
+    _print_success_panel(
+        "Domain layer has been generated successfully.\n"
+        "Review the generated files and adjust as needed."
+    )
 
 
 @generate_app.command("layout")
@@ -71,52 +91,66 @@ def generate_layout(
     debug: bool = typer.Option(False, "--debug", help="Enable debug mode to show all inputs/outputs")
 ) -> None:
     """Generate application layout structure based on SRS and policy."""
+    # Imported here so other commands (and --help) don't pay for them
+    import yaml
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from smartgen.services.layout_generator import (
+        LayoutGeneratorError,
+        LayoutGeneratorService,
+    )
+
     project_dir = Path.cwd()
+    service = LayoutGeneratorService(debug=debug)
+    
+    # Show progress spinner while generating
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        transient=True,
+    )
     
     try:
-        service = LayoutGeneratorService(debug=debug)
-        
-        # Show progress spinner while generating
-        progress = Progress(
-            SpinnerColumn(),
-            TextColumn("{task.description}"),
-            transient=True,
-        )
-        
         with progress:
             task_id = progress.add_task("Generating application layout...", start=True)
             result = service.generate_layout(project_dir)
             progress.update(task_id, description="Application layout generated!")
-        
-        typer.echo(
-            typer.style("✓ ", fg=typer.colors.GREEN)
-            + f"Layout structure generated using provider '{result.provider_name}'."
-        )
-        
-        typer.echo(
-            typer.style("✓ ", fg=typer.colors.GREEN)
-            + f"Generated {len(result.generated_files)} file(s):"
-        )
-        
-        for file_path in result.generated_files:
-            typer.echo(f"  - {file_path.relative_to(project_dir)}")
-        
-        rich_print(
-            Panel.fit(
-                "Application layout has been generated successfully.\n"
-                "Review the generated files and adjust as needed.",
-                title="Success",
-                border_style="green",
-            )
-        )
-        
     except LayoutGeneratorError as exc:
-        typer.echo(typer.style("✗ ", fg=typer.colors.RED) + str(exc), err=True)
-        raise typer.Exit(1)
+        typer.echo(CROSS + str(exc), err=True)
+        raise typer.Exit(1) from None
+    except yaml.YAMLError as exc:
+        typer.echo(CROSS + f"Invalid YAML: {exc}", err=True)
+        raise typer.Exit(1) from None
+    except OSError as exc:
+        typer.echo(CROSS + f"File system error: {exc}", err=True)
+        raise typer.Exit(1) from None
     except Exception as exc:
-        typer.echo(
-            typer.style("✗ ", fg=typer.colors.RED) + f"Unexpected error: {exc}",
-            err=True
-        )
-        raise typer.Exit(1)
+        # Keep the traceback when debugging; otherwise report it cleanly
+        if debug:
+            raise
+        typer.echo(CROSS + f"Unexpected error: {exc}", err=True)
+        raise typer.Exit(1) from None
+    
+    typer.echo(
+        CHECK
+        + f"Layout structure generated using provider '{result.provider_name}'."
+    )
+    
+    typer.echo(
+        CHECK
+        + f"Generated {len(result.generated_files)} file(s):"
+    )
+    
+    if result.generated_files:
+        # One write for the whole listing instead of one per file; relpath
+        # since LLM-chosen paths need not lie under the project directory
+        typer.echo("\n".join(
+            f"  - {os.path.relpath(file_path, project_dir)}"
+            for file_path in result.generated_files
+        ))
+    
+    _print_success_panel(
+        "Application layout has been generated successfully.\n"
+        "Review the generated files and adjust as needed."
+    )
 
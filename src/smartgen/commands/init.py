@@ -1,25 +1,93 @@
 """Project initialization command."""
+from __future__ import annotations
+
+import time
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any
 import typer
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeElapsedColumn,
-    TimeRemainingColumn,
-)
-from rich.panel import Panel
-from rich import print as rich_print
-
-from smartgen.services.llm_init import (
-    LLMInitError,
-    MissingApiKeyError,
-    MissingConfigError,
-    UnsupportedLocalProviderError,
-    LLMInitService,
-)
+
+from smartgen.commands._status import CHECK, CROSS
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+# Minimum seconds between progress redraws while a model is downloading
+_REDRAW_INTERVAL = 0.05
+
+
+class _ProgressAggregator:
+    """Fold Ollama pull progress events into a single Rich progress task.
+
+    Ollama reports progress per layer (digest); the bar shows the sum over
+    all layers seen so far.
+    """
+
+    __slots__ = (
+        "_progress",
+        "_task_id",
+        "_digest_totals",
+        "_digest_completed",
+        "_sum_total",
+        "_sum_completed",
+        "_last_status",
+        "_last_emit",
+    )
+
+    def __init__(self, progress: Progress, task_id: int) -> None:
+        self._progress = progress
+        self._task_id = task_id
+        self._digest_totals: dict[str, int] = {}
+        self._digest_completed: dict[str, int] = {}
+        # Running sums over the dicts above, kept in step on every update so
+        # each chunk costs O(1) instead of re-summing every layer
+        self._sum_total = 0
+        self._sum_completed = 0
+        self._last_status: Any = None
+        self._last_emit = 0.0
+
+    def __call__(self, payload: dict[str, Any]) -> None:
+        total = payload.get("total")
+        completed = payload.get("completed")
+        status = payload.get("status")
+        digest = payload.get("digest")
+
+        if digest and isinstance(total, int):
+            self._sum_total += total - self._digest_totals.get(digest, 0)
+            self._digest_totals[digest] = total
+        if digest and isinstance(completed, int):
+            self._sum_completed += completed - self._digest_completed.get(digest, 0)
+            self._digest_completed[digest] = completed
+        sum_total = self._sum_total
+        sum_completed = self._sum_completed
+
+        # Ollama can send thousands of chunks per second; only redraw on a
+        # status change, when a download finishes, or every _REDRAW_INTERVAL
+        now = time.monotonic()
+        if (
+            status == self._last_status
+            and sum_completed < sum_total
+            and now - self._last_emit < _REDRAW_INTERVAL
+        ):
+            return
+        self._last_status = status
+        self._last_emit = now
+
+        description = f"Pulling Ollama model ({status})" if status else None
+        if sum_total > 0:
+            percent = (sum_completed / sum_total) * 100
+            self._progress.update(
+                self._task_id,
+                total=sum_total,
+                completed=min(sum_completed, sum_total),
+                description=description,
+                percent_text=f"{percent:>3.0f}%",
+            )
+        else:
+            self._progress.update(
+                self._task_id,
+                description=description,
+                percent_text=" --%",
+            )
 
 
 def init_command(
@@ -28,6 +96,26 @@ def init_command(
     app: str = typer.Option("api", help="Application type"),
 ) -> None:
     """Initialize smartgen in the current directory."""
+    # Imported here so other commands (and --help) don't pay for them
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeElapsedColumn,
+        TimeRemainingColumn,
+    )
+    from rich.panel import Panel
+    from rich import print as rich_print
+
+    from smartgen.services.llm_init import (
+        LLMInitError,
+        MissingApiKeyError,
+        MissingConfigError,
+        UnsupportedLocalProviderError,
+        LLMInitService,
+    )
+
     progress = Progress(
         SpinnerColumn(),
         TextColumn("{task.description}"),
@@ -38,43 +126,6 @@ def init_command(
         transient=True,
     )
 
-    def _build_progress_callback(progress_obj: Progress, task_id: int) -> Callable[[dict[str, Any]], None]:
-        digest_totals: dict[str, int] = {}
-        digest_completed: dict[str, int] = {}
-
-        def _callback(payload: dict[str, Any]) -> None:
-            total = payload.get("total")
-            completed = payload.get("completed")
-            status = payload.get("status")
-            digest = payload.get("digest")
-
-            if digest and isinstance(total, int):
-                digest_totals[digest] = total
-            if digest and isinstance(completed, int):
-                digest_completed[digest] = completed
-
-            sum_total = sum(digest_totals.values())
-            sum_completed = sum(digest_completed.values())
-
-            update_kwargs: dict[str, Any] = {}
-            if sum_total > 0:
-                update_kwargs["total"] = sum_total
-                update_kwargs["completed"] = min(sum_completed, sum_total)
-            if status:
-                update_kwargs["description"] = f"Pulling Ollama model ({status})"
-            if sum_total > 0:
-                percent = (sum_completed / sum_total) * 100
-                update_kwargs["percent_text"] = f"{percent:>3.0f}%"
-            else:
-                update_kwargs["percent_text"] = " --%"
-
-            if update_kwargs:
-                progress_obj.update(task_id, **update_kwargs)
-            else:
-                progress_obj.update(task_id, description="Pulling Ollama model")
-
-        return _callback
-
     try:
         with progress:
             task_id = progress.add_task(
@@ -82,7 +133,7 @@ def init_command(
                 total=None,
                 percent_text=" --%",
             )
-            progress_callback = _build_progress_callback(progress, task_id)
+            progress_callback = _ProgressAggregator(progress, task_id)
             service = LLMInitService(
                 ollama_progress_callback=progress_callback,
             )
@@ -93,28 +144,28 @@ def init_command(
                 app=app,
             )
     except MissingApiKeyError as exc:
-        typer.echo(typer.style("✗ ", fg=typer.colors.RED) + str(exc), err=True)
+        typer.echo(CROSS + str(exc), err=True)
         raise typer.Exit(1)
     except (MissingConfigError, UnsupportedLocalProviderError) as exc:
-        typer.echo(typer.style("✗ ", fg=typer.colors.RED) + str(exc), err=True)
+        typer.echo(CROSS + str(exc), err=True)
         raise typer.Exit(1)
     except LLMInitError as exc:
-        typer.echo(typer.style("✗ ", fg=typer.colors.RED) + str(exc), err=True)
+        typer.echo(CROSS + str(exc), err=True)
         raise typer.Exit(1)
 
     typer.echo(
-        typer.style("✓ ", fg=typer.colors.GREEN)
+        CHECK
         + f"Initialized with provider '{result.provider_name}'."
     )
 
     if result.pull_response:
         typer.echo(
-            typer.style("✓ ", fg=typer.colors.GREEN)
+            CHECK
             + "Ollama model pulled successfully."
         )
 
     typer.echo(
-        typer.style("✓ ", fg=typer.colors.GREEN)
+        CHECK
         + f"Created {result.yaml_path.name} in {result.yaml_path.parent}"
     )
 
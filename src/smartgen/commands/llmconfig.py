@@ -2,10 +2,14 @@
 import typer
 from typing import Optional
 
+from smartgen.commands._status import CHECK, CROSS
 from smartgen.config import ConfigManager
 
 llmconfig_app = typer.Typer(help="Configure LLM settings")
 
+# Provider names that are treated as local LLMs when added
+_LOCAL_PROVIDERS = frozenset({"ollama", "lm-studio", "local"})
+
 
 @llmconfig_app.command()
 def set_config(
@@ -39,7 +43,7 @@ def set_config(
     try:
         if add:
             # Determine if it's cloud or local based on common names
-            provider_type = "local" if add.lower() in ["ollama", "lm-studio", "local"] else "cloud"
+            provider_type = "local" if add.lower() in _LOCAL_PROVIDERS else "cloud"
             ConfigManager.add_provider(
                 name=add,
                 provider_type=provider_type,
@@ -48,7 +52,7 @@ def set_config(
                 url=url,
             )
             typer.echo(
-                typer.style("✓ ", fg=typer.colors.GREEN)
+                CHECK
                 + f"Provider '{add}' saved (type: {provider_type})"
             )
         elif default and api_key:
@@ -59,19 +63,19 @@ def set_config(
                 api_key=api_key,
             )
             typer.echo(
-                typer.style("✓ ", fg=typer.colors.GREEN)
+                CHECK
                 + f"LLM config saved: provider={default}"
             )
         else:
             typer.echo(
-                typer.style("✗ ", fg=typer.colors.RED)
+                CROSS
                 + "Please provide either --add or (--default + --api-key)",
                 err=True,
             )
             raise typer.Exit(1)
     except Exception as e:
         typer.echo(
-            typer.style("✗ ", fg=typer.colors.RED) + f"Error saving config: {e}",
+            CROSS + f"Error saving config: {e}",
             err=True,
         )
         raise typer.Exit(1)
@@ -85,12 +89,12 @@ def set_default(
     try:
         ConfigManager.set_default_provider(provider)
         typer.echo(
-            typer.style("✓ ", fg=typer.colors.GREEN)
+            CHECK
             + f"Default provider set to: {provider}"
         )
     except ValueError as e:
         typer.echo(
-            typer.style("✗ ", fg=typer.colors.RED) + f"Error: {e}",
+            CROSS + f"Error: {e}",
             err=True,
         )
         raise typer.Exit(1)
@@ -104,12 +108,12 @@ def remove(
     try:
         ConfigManager.remove_provider(provider)
         typer.echo(
-            typer.style("✓ ", fg=typer.colors.GREEN)
+            CHECK
             + f"Provider '{provider}' removed"
         )
     except ValueError as e:
         typer.echo(
-            typer.style("✗ ", fg=typer.colors.RED) + f"Error: {e}",
+            CROSS + f"Error: {e}",
             err=True,
         )
         raise typer.Exit(1)
@@ -1,36 +1,237 @@
 """Configuration management for smartgen."""
-import json
+import copy
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
+
+from smartgen import _json
+
+
+_PROVIDER_FIELDS = frozenset({"type", "api_key", "model", "url"})
+
+
+@dataclass(slots=True)
+class LLMProvider:
+    """A configured LLM provider entry."""
+
+    type: Optional[str] = None
+    api_key: Optional[str] = None
+    model: Optional[str] = None
+    url: Optional[str] = None
+    # Keys this version doesn't know about, preserved on save
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LLMProvider":
+        """Build a provider from its JSON representation."""
+        extra = {k: v for k, v in data.items() if k not in _PROVIDER_FIELDS}
+        return cls(
+            type=data.get("type"),
+            api_key=data.get("api_key"),
+            model=data.get("model"),
+            url=data.get("url"),
+            extra=extra,
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to the JSON representation, omitting unset fields."""
+        data = {
+            key: value
+            for key, value in (
+                ("type", self.type),
+                ("api_key", self.api_key),
+                ("model", self.model),
+                ("url", self.url),
+            )
+            if value is not None
+        }
+        data.update(self.extra)
+        return data
+
+
+@dataclass(slots=True)
+class LLMConfig:
+    """The "llm" section of the config file."""
+
+    default: Optional[str] = None
+    providers: dict[str, LLMProvider] = field(default_factory=dict)
+    # Keys this version doesn't know about, preserved on save
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LLMConfig":
+        """Build the LLM section from its JSON representation."""
+        extra = {k: v for k, v in data.items() if k not in ("default", "providers")}
+        providers = {
+            name: LLMProvider.from_dict(provider)
+            for name, provider in data.get("providers", {}).items()
+        }
+        return cls(default=data.get("default"), providers=providers, extra=extra)
+
+    def to_dict(self) -> dict:
+        """Convert to the JSON representation."""
+        data: dict[str, Any] = {
+            "providers": {
+                name: provider.to_dict() for name, provider in self.providers.items()
+            }
+        }
+        if self.default is not None:
+            data["default"] = self.default
+        data.update(self.extra)
+        return data
 
 
 class ConfigManager:
-    """Manages configuration files and settings."""
+    """Manages configuration files and settings.
+
+    Every method takes an optional config_file to use instead of
+    CONFIG_FILE; its parent directory then stands in for CONFIG_DIR.
+    """
 
     CONFIG_DIR = Path.home() / ".smartgen"
     CONFIG_FILE = CONFIG_DIR / ".llmconfig"
+    # "fsync" flushes each save to disk before renaming it into place;
+    # "none" leaves that to the OS. SMARTGEN_FSYNC_CONFIG also turns it on.
+    DURABILITY = "none"
+
+    # Last parsed config, keyed by (path, mtime_ns, size) of the file it came from
+    _cache_key: Optional[tuple[str, int, int]] = None
+    _cache: Optional[dict] = None
+    # Config directory already created by this process
+    _ensured_dir: Optional[Path] = None
+    # Nesting depth of batch() blocks, and the configs they will write on
+    # exit, keyed by config file
+    _batch_depth = 0
+    _pending: dict[Path, dict] = {}
+
+    @classmethod
+    def _resolve_paths(cls, config_file: Optional[Path] = None) -> tuple[Path, Path]:
+        """Get the (config directory, config file) a call should use."""
+        if config_file is None:
+            return cls.CONFIG_DIR, cls.CONFIG_FILE
+        return config_file.parent, config_file
 
     @classmethod
-    def ensure_config_dir(cls) -> Path:
-        """Ensure the config directory exists."""
-        cls.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        return cls.CONFIG_DIR
+    def ensure_config_dir(cls, config_file: Optional[Path] = None) -> Path:
+        """Ensure the config directory exists.
+
+        Only the first call for a given directory touches the filesystem.
+        """
+        config_dir, _ = cls._resolve_paths(config_file)
+        if cls._ensured_dir != config_dir:
+            config_dir.mkdir(parents=True, exist_ok=True)
+            cls._ensured_dir = config_dir
+        return config_dir
+
+    @staticmethod
+    def _stat_key(config_file: Path) -> Optional[tuple[str, int, int]]:
+        """Get the cache key for the config file, or None if it is missing."""
+        try:
+            st = os.stat(config_file)
+        except FileNotFoundError:
+            return None
+        return (str(config_file), st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def load_config(cls, config_file: Optional[Path] = None) -> dict:
+        """Load configuration from file.
+
+        The parsed file is cached until its mtime or size changes; callers
+        always receive their own copy and may mutate it freely.
+        """
+        _, config_file = cls._resolve_paths(config_file)
+        pending = cls._pending.get(config_file)
+        if pending is not None:
+            return copy.deepcopy(pending)
+        cls.ensure_config_dir(config_file)
+        key = cls._stat_key(config_file)
+        if key is None:
+            return {}
+        if key != cls._cache_key:
+            cls._cache = _json.loads(config_file.read_bytes())
+            cls._cache_key = key
+        return copy.deepcopy(cls._cache)
 
     @classmethod
-    def load_config(cls) -> dict:
-        """Load configuration from file."""
-        cls.ensure_config_dir()
-        if cls.CONFIG_FILE.exists():
-            with open(cls.CONFIG_FILE, "r") as f:
-                return json.load(f)
-        return {}
+    def save_config(cls, config: dict, config_file: Optional[Path] = None) -> None:
+        """Save configuration to file.
+
+        The file is written to a sibling temp file and renamed into place,
+        so readers never see partially written JSON. Set DURABILITY to
+        "fsync" (or SMARTGEN_FSYNC_CONFIG) to also fsync before the rename.
+        Inside a batch() block the write is deferred until the block exits.
+        """
+        _, config_file = cls._resolve_paths(config_file)
+        if cls._batch_depth:
+            cls._pending[config_file] = copy.deepcopy(config)
+            return
+        cls._write_config(config, config_file)
+
+    @classmethod
+    @contextmanager
+    def batch(cls) -> Iterator[None]:
+        """Group several config changes into a single write.
+
+        Saves inside the block are kept in memory, and loads see them; the
+        last config saved to each file is written once when the outermost
+        block exits. If a block raises, the changes it made are discarded,
+        even when an enclosing block catches the exception.
+        """
+        # Saved configs are deep copies that are replaced, never mutated,
+        # so a shallow copy is enough to roll this block back
+        outer_pending = dict(cls._pending)
+        cls._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            cls._pending = outer_pending
+            raise
+        finally:
+            cls._batch_depth -= 1
+        if not cls._batch_depth:
+            pending, cls._pending = cls._pending, {}
+            for config_file, config in pending.items():
+                cls._write_config(config, config_file)
 
     @classmethod
-    def save_config(cls, config: dict) -> None:
-        """Save configuration to file."""
-        cls.ensure_config_dir()
-        with open(cls.CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+    def _write_config(cls, config: dict, config_file: Path) -> None:
+        """Write the config file and refresh the cache."""
+        cls.ensure_config_dir(config_file)
+        tmp_file = config_file.with_name(config_file.name + ".tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(_json.dumps(config))
+                if cls.DURABILITY == "fsync" or os.environ.get("SMARTGEN_FSYNC_CONFIG"):
+                    f.flush()
+                    os.fsync(f.fileno())
+            try:
+                # Keep any permissions the user set on the file holding API keys
+                os.chmod(tmp_file, os.stat(config_file).st_mode)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_file, config_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+        cls._cache = copy.deepcopy(config)
+        cls._cache_key = cls._stat_key(config_file)
+
+    @classmethod
+    def _load_llm(cls, config_file: Optional[Path] = None) -> tuple[dict, Optional[LLMConfig]]:
+        """Load the config and its parsed "llm" section (None if absent)."""
+        config = cls.load_config(config_file)
+        llm = config.get("llm")
+        return config, LLMConfig.from_dict(llm) if llm is not None else None
+
+    @classmethod
+    def _save_llm(
+        cls, config: dict, llm: LLMConfig, config_file: Optional[Path] = None
+    ) -> None:
+        """Write an updated "llm" section back into the config and save it."""
+        config["llm"] = llm.to_dict()
+        cls.save_config(config, config_file)
 
     @classmethod
     def add_provider(
@@ -40,88 +241,93 @@ class ConfigManager:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         url: Optional[str] = None,
-    ) -> None:
-        """Add or update an LLM provider."""
-        config = cls.load_config()
-        if "llm" not in config:
-            config["llm"] = {}
-        if "providers" not in config["llm"]:
-            config["llm"]["providers"] = {}
+        config_file: Optional[Path] = None,
+    ) -> dict:
+        """Add or update an LLM provider and return the updated config."""
+        config, llm = cls._load_llm(config_file)
+        if llm is None:
+            llm = LLMConfig()
 
         # Check if this is the first provider
-        is_first_provider = len(config["llm"]["providers"]) == 0
-
-        provider_config = {"type": provider_type}
+        is_first_provider = not llm.providers
 
-        if api_key:
-            provider_config["api_key"] = api_key
+        provider = LLMProvider(type=provider_type, api_key=api_key or None)
         if model:
-            provider_config["model"] = model
-        else:
+            provider.model = model
+        elif provider_type == "local":
             # Set default model for local providers
-            if provider_type == "local":
-                provider_config["model"] = "deepseek-coder-v2"
+            provider.model = "deepseek-coder-v2"
         if url:
-            provider_config["url"] = url
-        else:
+            provider.url = url
+        elif provider_type == "local":
             # Set default URL for local providers
-            if provider_type == "local":
-                provider_config["url"] = "http://localhost:11434"
+            provider.url = "http://localhost:11434"
 
-        config["llm"]["providers"][name] = provider_config
+        llm.providers[name] = provider
 
         # Auto-set as default if it's the first provider
         if is_first_provider:
-            config["llm"]["default"] = name
+            llm.default = name
 
-        cls.save_config(config)
+        cls._save_llm(config, llm, config_file)
+        return config
 
     @classmethod
-    def set_default_provider(cls, provider_name: str) -> None:
-        """Set the default provider."""
-        config = cls.load_config()
-        if "llm" not in config:
-            config["llm"] = {}
-        providers = config["llm"].get("providers", {})
-        if provider_name not in providers:
+    def set_default_provider(
+        cls, provider_name: str, config_file: Optional[Path] = None
+    ) -> dict:
+        """Set the default provider and return the updated config."""
+        config, llm = cls._load_llm(config_file)
+        if llm is None or provider_name not in llm.providers:
             raise ValueError(f"Provider '{provider_name}' not found")
-        config["llm"]["default"] = provider_name
-        cls.save_config(config)
+        llm.default = provider_name
+        cls._save_llm(config, llm, config_file)
+        return config
 
     @classmethod
-    def remove_provider(cls, provider_name: str) -> None:
-        """Remove a provider."""
-        config = cls.load_config()
-        if "llm" not in config:
-            return
-        providers = config["llm"].get("providers", {})
-        if provider_name not in providers:
+    def remove_provider(
+        cls, provider_name: str, config_file: Optional[Path] = None
+    ) -> dict:
+        """Remove a provider and return the updated config."""
+        config, llm = cls._load_llm(config_file)
+        if llm is None:
+            return config
+        if provider_name not in llm.providers:
             raise ValueError(f"Provider '{provider_name}' not found")
-        del config["llm"]["providers"][provider_name]
+        del llm.providers[provider_name]
         # If this was the default, unset default
-        if config["llm"].get("default") == provider_name:
-            config["llm"].pop("default", None)
-        cls.save_config(config)
+        if llm.default == provider_name:
+            llm.default = None
+        cls._save_llm(config, llm, config_file)
+        return config
 
     @classmethod
-    def update_llm_config(cls, default: str, api_key: str) -> None:
+    def update_llm_config(
+        cls, default: str, api_key: str, config_file: Optional[Path] = None
+    ) -> None:
         """Update LLM configuration (legacy)."""
-        cls.add_provider(name=default, provider_type="cloud", api_key=api_key)
-        cls.set_default_provider(default)
+        with cls.batch():
+            cls.add_provider(
+                name=default,
+                provider_type="cloud",
+                api_key=api_key,
+                config_file=config_file,
+            )
+            cls.set_default_provider(default, config_file)
 
     @classmethod
-    def get_llm_config(cls) -> Optional[dict]:
+    def get_llm_config(cls, config_file: Optional[Path] = None) -> Optional[dict]:
         """Get LLM configuration."""
-        config = cls.load_config()
+        config = cls.load_config(config_file)
         return config.get("llm")
 
     @classmethod
-    def get_api_key(cls, provider: Optional[str] = None) -> Optional[str]:
+    def get_api_key(
+        cls, provider: Optional[str] = None, config_file: Optional[Path] = None
+    ) -> Optional[str]:
         """Get API key for a provider."""
-        config = cls.load_config()
-        llm_config = config.get("llm", {})
-        if not provider:
-            provider = llm_config.get("default")
-        if provider and "providers" in llm_config:
-            return llm_config["providers"].get(provider, {}).get("api_key")
-        return None
+        _, llm = cls._load_llm(config_file)
+        if llm is None:
+            return None
+        provider_config = llm.providers.get(provider or llm.default)
+        return provider_config.api_key if provider_config else None
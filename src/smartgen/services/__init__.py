@@ -1,4 +1,6 @@
 """Service layer for smartgen."""
+from typing import TYPE_CHECKING, Any
+
 from smartgen.services.domain_generator import (
     DomainGeneratorService,
     GeneratorError,
@@ -8,11 +10,21 @@ from smartgen.services.domain_generator import (
     LLMError,
     DomainGenerationResult,
 )
-from smartgen.services.layout_generator import (
-    LayoutGeneratorService,
-    LayoutGeneratorError,
-    LayoutGenerationResult,
-)
+
+if TYPE_CHECKING:
+    from smartgen.services.layout_generator import (
+        LayoutGeneratorService,
+        LayoutGeneratorError,
+        LayoutGenerationResult,
+    )
+
+# Loaded on first access so commands that only generate domains don't
+# import the layout module
+_LAYOUT_EXPORTS = frozenset({
+    "LayoutGeneratorService",
+    "LayoutGeneratorError",
+    "LayoutGenerationResult",
+})
 
 __all__ = [
     "DomainGeneratorService",
@@ -26,3 +38,13 @@ __all__ = [
     "LayoutGeneratorError",
     "LayoutGenerationResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve layout exports lazily (PEP 562)."""
+    if name in _LAYOUT_EXPORTS:
+        from smartgen.services import layout_generator
+        value = getattr(layout_generator, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
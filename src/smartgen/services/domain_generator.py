@@ -1,11 +1,47 @@
 """Domain generation service using LLM."""
 from __future__ import annotations
 
+import copy
+import hashlib
+import importlib.resources
+import importlib.util
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
-import yaml
-import json
+from typing import Any, Callable
+from smartgen import _json
+
+# Decodes the first JSON object embedded in free-form LLM output
+_JSON_DECODER = json.JSONDecoder()
+# A JSON object inside a ```json ... ``` or bare ``` ... ``` fence
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Bundled policy files, resolved once; also works for zipped installs
+_POLICIES_ROOT = importlib.resources.files("smartgen").joinpath("policies", "ddd")
+
+# Provider settings that live only in the global config and are merged in
+_SENSITIVE_FIELDS = frozenset({"api_key", "api_secret", "token", "password"})
+
+# LLM clients reused across calls so their HTTP connection pools are kept
+_CLIENT_CACHE: dict[tuple[str, ...], Any] = {}
+
+# Debug output longer than this skips Rich rendering entirely
+_DEBUG_PLAIN_THRESHOLD = 100_000
+# Longest text shown inside a Rich debug panel
+_DEBUG_MAX_CHARS = 10_000
+
+# Rich console shared by all debug output; created on first use
+_CONSOLE: Any = None
+# (Panel, Syntax, Text) from rich; imported on first use
+_RICH: Any = None
+# Checked once without importing rich, which stays lazy until a debug print
+_HAS_RICH = importlib.util.find_spec("rich") is not None
 
 
 class GeneratorError(RuntimeError):
@@ -28,6 +64,142 @@ class LLMError(GeneratorError):
     """Raised when LLM call fails."""
 
 
+# Domain generation prompts, filled in by DomainGeneratorService. Everything
+# that only depends on the policy goes in the system prompt, so it is a
+# byte-identical prefix across projects and providers can cache it; the
+# per-project SRS goes in the user prompt.
+_SYSTEM_PROMPT_TEMPLATE = """You are a domain modeling expert. Based on the Software Requirements Specification (SRS) provided by the user and the Domain-Driven Design (DDD) policy below, generate the domain layer code.
+
+# DDD Policy and Guidelines:
+{policy}
+
+# Instructions:
+1. Analyze the requirements in the SRS
+2. Identify domain entities, value objects, aggregates, and domain services
+3. Generate Python code following the DDD policy strictly
+4. The SRS may contain requirements that do not need to be implemented in the domain layer; only generate code for domain-relevant requirements
+5. IMPORTANT: Return the generated code in a JSON format with file paths and content as shown below:
+
+# Output Format:
+Return a JSON object with the following structure:
+{output_format}"""
+
+# Example response shown to the model; kept out of the template so its
+# braces don't need escaping
+_OUTPUT_FORMAT_EXAMPLE = """{
+    "files": [
+        {
+            "path": "src/domain/aggregates/order.py",
+            "content": "# Generated code here..."
+        },
+        {
+            "path": "src/domain/value_objects/email.py",
+            "content": "# Generated code here..."
+        }
+    ]
+}"""
+
+_USER_PROMPT_TEMPLATE = """# Software Requirements Specification:
+{srs}
+
+Generate the domain layer code now:"""
+
+
+@lru_cache(maxsize=32)
+def _cached_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime, size) so edits are picked up.
+
+    The size guards against edits landing within the filesystem's mtime
+    granularity.
+    """
+    # yaml is only imported once a command actually reads project config
+    from smartgen import _yaml
+
+    # The loader detects the encoding itself, so hand it the raw bytes
+    return _yaml.safe_load(Path(path).read_bytes())
+
+
+# One policy file per language, so a handful of entries is plenty
+@lru_cache(maxsize=8)
+def _cached_policy(path: str, mtime_ns: int, size: int) -> str:
+    """Read a policy file; cached per (path, mtime, size) so edits are picked up."""
+    return Path(path).read_bytes().decode("utf-8")
+
+
+# Keyed by the policy text rather than the language, so an edited policy
+# file still produces a fresh prompt; one entry per language in practice
+@lru_cache(maxsize=8)
+def _system_prompt_for(policy: str) -> str:
+    """Format a policy into the system prompt, shared by every service."""
+    return _SYSTEM_PROMPT_TEMPLATE.format(
+        policy=policy, output_format=_OUTPUT_FORMAT_EXAMPLE
+    )
+
+
+def _cached_client(key: tuple[str, ...], factory: Callable[[], Any]) -> Any:
+    """Get a cached LLM client, creating it with factory on first use."""
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = factory()
+        _CLIENT_CACHE[key] = client
+    return client
+
+
+def _api_key_digest(api_key: str | None) -> str:
+    """Short digest identifying an API key without keeping the key itself."""
+    return hashlib.blake2b((api_key or "").encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _get_console() -> Any:
+    """Get the shared Rich console, creating it on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+def _get_rich() -> Any:
+    """Get the Rich renderables used for debug output, importing them once."""
+    global _RICH
+    if _RICH is None:
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+        from rich.text import Text
+        _RICH = (Panel, Syntax, Text)
+    return _RICH
+
+
+@cache
+def _get_ollama() -> Any:
+    """Import the ollama package on first use.
+
+    Raises:
+        LLMError: If ollama is not installed
+    """
+    try:
+        import ollama
+    except ImportError as exc:
+        raise LLMError(
+            "ollama package not installed. Install it with: pip install ollama"
+        ) from exc
+    return ollama
+
+
+@cache
+def _get_openai() -> Any:
+    """Import the openai package on first use."""
+    import openai
+    return openai
+
+
+@cache
+def _get_lexer(name: str) -> Any:
+    """Get a Pygments lexer by name, built once per process."""
+    from pygments.lexers import get_lexer_by_name
+    return get_lexer_by_name(name)
+
+
 @dataclass(frozen=True)
 class DomainGenerationResult:
     """Result of domain generation."""
@@ -40,6 +212,11 @@ class DomainGenerationResult:
 class DomainGeneratorService:
     """Service for generating domain elements using LLM."""
 
+    # Attempts per LLM request when the failure looks transient
+    LLM_MAX_ATTEMPTS = 3
+    # Delay before the first retry; doubled after each further failure
+    LLM_RETRY_BACKOFF_SECONDS = 0.5
+
     def __init__(self, debug: bool = False) -> None:
         """Initialize the domain generator service.
         
@@ -47,6 +224,11 @@ class DomainGeneratorService:
             debug: Enable debug output for all steps
         """
         self._debug = debug
+        # Provider type -> handler; subclasses can register more types here
+        self._dispatch: dict[str, Callable[[dict[str, Any], str, str], str]] = {
+            "local": self._call_ollama,
+            "cloud": self._call_cloud_provider,
+        }
 
     def generate_domain(self, project_dir: Path) -> DomainGenerationResult:
         """
@@ -95,7 +277,7 @@ class DomainGeneratorService:
         policy_content = self._read_policy(language)
         
         if self._debug:
-            self._print_debug("DDD Policy", policy_content[:500] + "..." if len(policy_content) > 500 else policy_content, is_text=True)
+            self._print_debug("DDD Policy", policy_content, is_text=True, preview_chars=500)
         
         # 4. Call LLM to generate domain elements
         if self._debug:
@@ -128,14 +310,17 @@ class DomainGeneratorService:
     def _load_project_config(self, project_dir: Path) -> dict[str, Any]:
         """Load .smartgen.yml from project directory."""
         config_path = project_dir / ".smartgen.yml"
-        if not config_path.exists():
+        try:
+            st = config_path.stat()
+            config = _cached_yaml(str(config_path), st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
             raise MissingProjectConfigError(
                 f"'.smartgen.yml' not found in {project_dir}. "
                 "Run 'smartgen init' first."
-            )
+            ) from None
         
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        # Copied so callers can't mutate the cached parse
+        return copy.deepcopy(config)
     
     def _merge_with_global_config(self, provider_name: str, project_config: dict[str, Any]) -> dict[str, Any]:
         """Merge project provider config with global config to get API keys.
@@ -152,8 +337,6 @@ class DomainGeneratorService:
         """
         from smartgen.config import ConfigManager
         
-        merged_config = dict(project_config)
-        
         # Load global config
         global_config = ConfigManager.load_config()
         global_llm = global_config.get("llm", {})
@@ -161,24 +344,26 @@ class DomainGeneratorService:
         global_provider_config = global_providers.get(provider_name, {})
         
         # Merge sensitive fields from global config
-        sensitive_fields = ["api_key", "api_secret", "token", "password"]
-        for field in sensitive_fields:
-            if field in global_provider_config and field not in merged_config:
-                merged_config[field] = global_provider_config[field]
-        
-        return merged_config
+        extras = {
+            key: value
+            for key, value in global_provider_config.items()
+            if key in _SENSITIVE_FIELDS and key not in project_config
+        }
+        return {**project_config, **extras}
 
     def _read_srs(self, project_dir: Path) -> str:
         """Read the Software Requirements Specification."""
         srs_path = project_dir / "srs.md"
-        if not srs_path.exists():
+        try:
+            content = srs_path.read_bytes().decode("utf-8")
+        except FileNotFoundError:
             raise MissingSRSError(
                 f"'srs.md' not found in {project_dir}. "
                 "Please create the SRS file first."
-            )
+            ) from None
         
-        content = srs_path.read_text(encoding="utf-8")
-        if not content.strip():
+        # isspace() checks in place instead of building a stripped copy
+        if not content or content.isspace():
             raise MissingSRSError(
                 "srs.md is empty. Please provide requirements before generating domain."
             )
@@ -187,16 +372,18 @@ class DomainGeneratorService:
 
     def _read_policy(self, language: str) -> str:
         """Read the DDD domain policy file."""
-        # Get the path to the policy file relative to this module
-        policies_dir = Path(__file__).parent.parent / "policies" / "ddd" / language
-        policy_path = policies_dir / "domain.txt"
+        resource = _POLICIES_ROOT.joinpath(language, "domain.txt")
         
-        if not policy_path.exists():
+        try:
+            if isinstance(resource, Path):
+                st = resource.stat()
+                return _cached_policy(str(resource), st.st_mtime_ns, st.st_size)
+            # Resources inside an archive can't be stat'ed; read them directly
+            return resource.read_text(encoding="utf-8")
+        except FileNotFoundError:
             raise MissingPolicyError(
-                f"Policy file not found for language '{language}' at {policy_path}"
-            )
-        
-        return policy_path.read_text(encoding="utf-8")
+                f"Policy file not found for language '{language}' at {resource}"
+            ) from None
 
     def _call_llm(
         self,
@@ -217,81 +404,104 @@ class DomainGeneratorService:
         """
         provider_type = provider_config.get("type")
         
-        # Build the prompt
-        prompt = self._build_prompt(srs_content, policy_content)
+        # Build the prompts
+        system_prompt = self._build_system_prompt(policy_content)
+        user_prompt = self._build_user_prompt(srs_content)
         
         if self._debug:
-            self._print_debug("Prompt sent to LLM", prompt, is_text=True)
-        
-        if provider_type == "local":
-            return self._call_ollama(provider_config, prompt)
-        elif provider_type == "cloud":
-            return self._call_cloud_provider(provider_config, prompt)
-        else:
+            self._print_debug("System prompt sent to LLM", system_prompt, is_text=True)
+            self._print_debug("User prompt sent to LLM", user_prompt, is_text=True)
+        
+        # Handlers stream the completion but return it whole: the full text
+        # is part of DomainGenerationResult, and a retried request has to
+        # replace everything received so far, so files are only written
+        # once the response is complete.
+        handler = self._dispatch.get(provider_type)
+        if handler is None:
             raise LLMError(f"Unsupported provider type: {provider_type}")
+        return handler(provider_config, system_prompt, user_prompt)
 
-    def _build_prompt(self, srs_content: str, policy_content: str) -> str:
-        """Build the prompt for the LLM."""
-        return f"""You are a domain modeling expert. Based on the Software Requirements Specification (SRS) and the Domain-Driven Design (DDD) policy provided, generate the domain layer code.
-
-# DDD Policy and Guidelines:
-{policy_content}
-
-# Software Requirements Specification:
-{srs_content}
-
-# Instructions:
-1. Analyze the requirements in the SRS
-2. Identify domain entities, value objects, aggregates, and domain services
-3. Generate Python code following the DDD policy strictly
-4. The SRS may contain requirements that do not need to be implemented in the domain layer; only generate code for domain-relevant requirements
-5. IMPORTANT: Return the generated code in a JSON format with file paths and content as shown below:
-
-# Output Format:
-Return a JSON object with the following structure:
-{{
-    "files": [
-        {{
-            "path": "src/domain/aggregates/order.py",
-            "content": "# Generated code here..."
-        }},
-        {{
-            "path": "src/domain/value_objects/email.py",
-            "content": "# Generated code here..."
-        }}
-    ]
-}}
+    def _build_system_prompt(self, policy_content: str) -> str:
+        """Build the system prompt, which only depends on the policy."""
+        return _system_prompt_for(policy_content)
 
-Generate the domain layer code now:"""
+    def _build_user_prompt(self, srs_content: str) -> str:
+        """Build the user prompt carrying the project's SRS."""
+        return _USER_PROMPT_TEMPLATE.format(srs=srs_content)
 
-    def _call_ollama(self, provider_config: dict[str, Any], prompt: str) -> str:
+    def _call_ollama(
+        self,
+        provider_config: dict[str, Any],
+        system_prompt: str,
+        user_prompt: str,
+    ) -> str:
         """Call Ollama local LLM."""
-        try:
-            import ollama
-        except ImportError as exc:
-            raise LLMError(
-                "ollama package not installed. Install it with: pip install ollama"
-            ) from exc
+        ollama = _get_ollama()
+        import httpx
         
         url = provider_config.get("url", "http://localhost:11434")
         model = provider_config.get("model", "deepseek-coder-v2")
         
         try:
-            client = ollama.Client(host=url)
-            response = client.chat(
-                model=model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
+            client = _cached_client(("ollama", url), lambda: ollama.Client(host=url))
+            # Streamed so a long generation isn't cut off by a read timeout
+            # while the server is still producing output; the stream is
+            # consumed inside the retry so a dropped stream is retried whole.
+            # The Ollama client reports refused connections as ConnectionError.
+            return self._with_retries(
+                lambda: "".join(
+                    chunk["message"]["content"] or ""
+                    for chunk in client.chat(
+                        model=model,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_prompt},
+                        ],
+                        stream=True,
+                    )
+                ),
+                retryable=(ConnectionError, httpx.TimeoutException),
             )
-            
-            return response["message"]["content"]
         except Exception as e:
             raise LLMError(f"Failed to call Ollama: {e}") from e
 
-    def _call_cloud_provider(self, provider_config: dict[str, Any], prompt: str) -> str:
+    def _with_retries(
+        self,
+        request: Callable[[], Any],
+        retryable: tuple[type[Exception], ...],
+    ) -> Any:
+        """Run an LLM request, retrying transient failures with backoff.
+        
+        Args:
+            request: Callable performing the request
+            retryable: Exception types worth retrying
+            
+        Returns:
+            Whatever request returns
+            
+        Raises:
+            Exception: The last error once LLM_MAX_ATTEMPTS is exhausted, or
+                any non-retryable error immediately
+        """
+        for attempt in range(1, self.LLM_MAX_ATTEMPTS + 1):
+            try:
+                return request()
+            except retryable as e:
+                if attempt == self.LLM_MAX_ATTEMPTS:
+                    raise
+                delay = self.LLM_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+                if self._debug:
+                    self._print_debug("Retrying LLM call", f"Attempt {attempt} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _call_cloud_provider(
+        self,
+        provider_config: dict[str, Any],
+        system_prompt: str,
+        user_prompt: str,
+    ) -> str:
         """Call cloud LLM provider (OpenAI chat models, Codex, etc.)."""
-        import openai
+        openai = _get_openai()
         
         api_key = provider_config.get("api_key")
         model = provider_config.get("model", "gpt-4")
@@ -301,39 +511,58 @@ Generate the domain layer code now:"""
         is_codex = self._is_codex_model(model)
         
         try:
-            client_kwargs: dict[str, Any] = {"api_key": api_key}
-            base_url = provider_config.get("base_url")
+            # The OpenAI SDK already retries connection errors, rate limits
+            # and 5xx responses with backoff; just align its attempt count
+            client_kwargs: dict[str, Any] = {
+                "api_key": api_key,
+                "max_retries": self.LLM_MAX_ATTEMPTS - 1,
+            }
             if base_url:
                 client_kwargs["base_url"] = base_url
             
-            client = openai.OpenAI(**client_kwargs)
+            client = _cached_client(
+                ("openai", _api_key_digest(api_key), base_url or ""),
+                lambda: openai.OpenAI(**client_kwargs),
+            )
             
             if is_codex:
                 # Codex models use the legacy completions API
                 if self._debug:
                     self._print_debug("Using Codex API", f"Model: {model} (legacy completions)")
                 
-                response = client.completions.create(
+                # The legacy API has no roles; the system prompt still leads
+                # so the prefix stays cacheable
+                stream = client.completions.create(
                     model=model,
-                    prompt=prompt,
+                    prompt=f"{system_prompt}\n\n{user_prompt}",
                     max_tokens=4000,
                     temperature=0.2,
+                    stream=True,
+                )
+                return "".join(
+                    chunk.choices[0].text or ""
+                    for chunk in stream
+                    if chunk.choices
                 )
-                return response.choices[0].text or ""
             else:
                 # Modern chat models (GPT-3.5, GPT-4, etc.)
                 if self._debug:
                     self._print_debug("Using Chat API", f"Model: {model}")
                 
-                response = client.chat.completions.create(
+                stream = client.chat.completions.create(
                     model=model,
                     messages=[
-                        {"role": "system", "content": "You are an expert software architect specializing in Domain-Driven Design. Return your response as valid JSON with this structure: {\"files\": [{\"path\": \"...\", \"content\": \"...\"}]}"},
-                        {"role": "user", "content": prompt}
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
                     ],
                     temperature=0.2,
+                    stream=True,
+                )
+                return "".join(
+                    chunk.choices[0].delta.content or ""
+                    for chunk in stream
+                    if chunk.choices
                 )
-                return response.choices[0].message.content or ""
         except Exception as e:
             raise LLMError(f"Failed to call cloud provider: {e}") from e
     
@@ -346,13 +575,9 @@ Generate the domain layer code now:"""
         Returns:
             True if it's a Codex model
         """
-        codex_models = [
-            "code-davinci-002",
-            "code-davinci-001", 
-            "code-cushman-002",
-            "code-cushman-001",
-        ]
-        return model in codex_models or model.startswith("code-")
+        # Every Codex model name (code-davinci-002, code-cushman-001, ...)
+        # carries this prefix
+        return model.startswith("code-")
     
     def _parse_llm_json_response(self, response: str) -> dict[str, Any]:
         """Parse JSON from LLM response with robust error handling.
@@ -371,36 +596,31 @@ Generate the domain layer code now:"""
         """
         # Try to parse as-is first (if JSON mode was used)
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
+            return _json.loads(response)
+        except _json.JSONDecodeError:
             pass
         
         # Try to extract JSON from markdown code blocks
         # Handle both ```json ... ``` and ``` ... ``` formats
-        for fence in ["```json", "```"]:
-            if fence in response:
-                try:
-                    start = response.find(fence) + len(fence)
-                    end = response.find("```", start)
-                    if end > start:
-                        json_str = response[start:end].strip()
-                        return json.loads(json_str)
-                except json.JSONDecodeError:
-                    pass
-        
-        # Try to extract JSON by finding { ... }
+        match = _JSON_FENCE_RE.search(response)
+        if match:
+            try:
+                return _json.loads(match.group(1))
+            except _json.JSONDecodeError:
+                pass
+        
+        # Decode the first JSON object in the text, in place and in one pass
         json_start = response.find("{")
-        json_end = response.rfind("}")
         
-        if json_start == -1 or json_end == -1 or json_end <= json_start:
+        if json_start == -1:
             raise LLMError(
                 "No valid JSON found in LLM response. "
                 "Make sure the model is configured correctly and supports JSON output."
             )
         
         try:
-            json_str = response[json_start:json_end + 1]
-            return json.loads(json_str)
+            data, _ = _JSON_DECODER.raw_decode(response, json_start)
+            return data
         except json.JSONDecodeError as e:
             # Show a helpful error message with a snippet of the response
             snippet = response[max(0, json_start):min(len(response), json_start + 200)]
@@ -424,32 +644,97 @@ Generate the domain layer code now:"""
         Returns:
             List of generated file paths
         """
-        generated_files = []
-        
         # Parse JSON from response
         data = self._parse_llm_json_response(llm_response)
         
-        files = data.get("files", [])
+        files = data.get("files", []) if isinstance(data, dict) else None
         if not files:
             raise LLMError("No files generated by LLM")
+        if not isinstance(files, list):
+            raise LLMError("Invalid LLM response: 'files' must be a list")
+        
+        # Check every entry before writing anything, so a malformed entry
+        # can't leave the project half-generated
+        for index, file_info in enumerate(files):
+            if not (
+                isinstance(file_info, dict)
+                and isinstance(file_info.get("path"), str)
+                and isinstance(file_info.get("content"), str)
+            ):
+                raise LLMError(
+                    f"Invalid LLM response: file entry {index} must have "
+                    "string 'path' and 'content' fields"
+                )
         
-        for file_info in files:
-            file_path = project_dir / file_info["path"]
-            file_content = file_info["content"]
-            
-            # Create parent directories
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write file
-            file_path.write_text(file_content, encoding="utf-8")
-            generated_files.append(file_path)
+        # Concurrent writers to one path would interleave, so a repeated
+        # path is written once, with its last entry's content
+        contents = dict(zip(
+            (project_dir / file_info["path"] for file_info in files),
+            (file_info["content"] for file_info in files),
+            strict=True,
+        ))
+        generated_files = list(contents)
+        
+        # Create each target directory once, rather than once per file. Where
+        # the platform allows it, keep each directory open and create files
+        # relative to it, so its path is resolved once rather than per file.
+        use_dir_fd = os.open in os.supports_dir_fd
+        dir_fds: dict[Path, int] = {}
+        try:
+            for directory in dict.fromkeys(file_path.parent for file_path in contents):
+                directory.mkdir(parents=True, exist_ok=True)
+                if use_dir_fd:
+                    dir_fds[directory] = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
             
-            if self._debug:
-                self._print_debug("Created file", str(file_path.relative_to(project_dir)))
+            # Files are independent, so write them concurrently; file I/O
+            # releases the GIL
+            with ThreadPoolExecutor(max_workers=min(32, len(contents))) as executor:
+                list(executor.map(
+                    self._write_file,
+                    contents.keys(),
+                    contents.values(),
+                    [dir_fds.get(file_path.parent) for file_path in contents],
+                ))
+        finally:
+            for fd in dir_fds.values():
+                os.close(fd)
+        
+        if self._debug:
+            for file_path in generated_files:
+                self._print_debug("Created file", os.path.relpath(file_path, project_dir))
         
         return generated_files
+
+    @staticmethod
+    def _write_file(file_path: Path, content: str, dir_fd: int | None = None) -> None:
+        """Write one generated file; its directory must already exist.
+        
+        Args:
+            file_path: Path of the file to write
+            content: File content
+            dir_fd: Open descriptor of the file's directory, if available
+        """
+        # Raw descriptor I/O skips the buffered file object; os.write may
+        # write less than asked, so loop until everything is out
+        data = memoryview(content.encode("utf-8"))
+        target = file_path if dir_fd is None else file_path.name
+        fd = os.open(
+            target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd
+        )
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
     
-    def _print_debug(self, title: str, content: Any, is_yaml: bool = False, is_text: bool = False) -> None:
+    def _print_debug(
+        self,
+        title: str,
+        content: Any,
+        is_yaml: bool = False,
+        is_text: bool = False,
+        preview_chars: int | None = None,
+    ) -> None:
         """Print debug information with nice formatting.
         
         Args:
@@ -457,28 +742,41 @@ Generate the domain layer code now:"""
             content: Content to display
             is_yaml: Format as YAML
             is_text: Format as plain text with text wrapping
+            preview_chars: Show only this many characters of text content,
+                followed by "..."
         """
-        try:
-            from rich.console import Console
-            from rich.panel import Panel
-            from rich.syntax import Syntax
-            from rich.text import Text
-            
-            console = Console()
-            
-            if is_yaml:
-                yaml_str = yaml.dump(content, default_flow_style=False, sort_keys=False)
-                syntax = Syntax(yaml_str, "yaml", theme="monokai", line_numbers=False)
-                console.print(Panel(syntax, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
-            elif is_text:
-                # Wrap long text for readability
-                text_obj = Text(str(content))
-                console.print(Panel(text_obj, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
-            else:
-                console.print(Panel(str(content), title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
-            console.print()  # Empty line for spacing
-        except ImportError:
-            # Fallback if rich is not available
-            print(f"\n=== {title} ===")
-            print(content)
-            print()
+        # Callers guard on self._debug before building their arguments;
+        # this keeps any unguarded call free when debug output is off
+        if not self._debug:
+            return
+        
+        if preview_chars is not None and isinstance(content, str) and len(content) > preview_chars:
+            content = content[:preview_chars] + "..."
+        
+        # Panels and highlighting are wasted when output is piped to a file,
+        # and rendering a huge response in a panel is slow
+        if not _HAS_RICH or not sys.stdout.isatty() or (
+            isinstance(content, str) and len(content) > _DEBUG_PLAIN_THRESHOLD
+        ):
+            print(f"\n=== {title} ===\n{content}\n")
+            return
+        
+        if isinstance(content, str) and len(content) > _DEBUG_MAX_CHARS:
+            omitted = len(content) - _DEBUG_MAX_CHARS
+            content = f"{content[:_DEBUG_MAX_CHARS]}\n... (truncated, {omitted} more characters)"
+        
+        Panel, Syntax, Text = _get_rich()
+        console = _get_console()
+        
+        if is_yaml:
+            from smartgen import _yaml
+            yaml_str = _yaml.safe_dump(content, default_flow_style=False, sort_keys=False)
+            syntax = Syntax(yaml_str, _get_lexer("yaml"), theme="monokai", line_numbers=False)
+            console.print(Panel(syntax, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
+        elif is_text:
+            # Wrap long text for readability
+            text_obj = Text(str(content))
+            console.print(Panel(text_obj, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
+        else:
+            console.print(Panel(str(content), title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
+        console.print()  # Empty line for spacing
@@ -1,11 +1,29 @@
 """Layout generation service using LLM."""
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
+import importlib.resources
+import importlib.util
+import json
+import os
+import re
+import sys
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
-import yaml
-import json
+
+from smartgen import _json
+from smartgen.services.llm_cache import (
+    CacheBackend,
+    cache_from_config,
+    cache_key,
+    cache_ttl,
+)
 
 
 class LayoutGeneratorError(RuntimeError):
@@ -28,6 +46,198 @@ class LLMError(LayoutGeneratorError):
     """Raised when LLM call fails."""
 
 
+# Layout generation prompt; filled in by LayoutGeneratorService._build_prompt
+_PROMPT_TEMPLATE = """You are a software architect specializing in layered architecture design. Based on the Software Requirements Specification (SRS), the existing Domain Layer files, and the layout policy provided, generate the structure (no implementations) for the Application, Infrastructure, and Interface layers.
+
+# Layout Policy and Guidelines:
+{policy}
+
+# Software Requirements Specification:
+{srs}
+{domain_files}
+# Instructions:
+1. Analyze the requirements in the SRS
+2. Review the existing domain models to understand what entities, value objects, and aggregates exist
+3. Design the Application, Infrastructure, and Interface layers that work with these domain models
+4. Organize files following the policy guidelines strictly
+5. IMPORTANT: Return the generated structure in a JSON format with file paths and content as shown below:
+
+# Output Format:
+Return a JSON object with the following structure:
+{{
+    "files": [
+        {{
+            "path": "src/application/use_cases/create_order_use_case.py",
+            "content": ""
+        }},
+        {{
+            "path": "src/infrastructure/repositories/order_repository.py",
+            "content": ""
+        }},
+        {{
+            "path": "src/interface/controllers/order_controller.py",
+            "content": ""
+        }}
+    ]
+}}
+
+Generate the application layout structure now:"""
+
+
+# System message for chat models
+_CHAT_SYSTEM_PROMPT = "You are an expert software architect. Return your response as valid JSON with this structure: {\"files\": [{\"path\": \"...\", \"content\": \"...\"}]}"
+
+# Decodes the first JSON object embedded in free-form LLM output
+_JSON_DECODER = json.JSONDecoder()
+# A JSON object inside a ```json ... ``` or bare ``` ... ``` fence
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Estimated tokens of domain source sent with each layout prompt
+_DOMAIN_TOKEN_BUDGET = 8000
+# Rough characters per token for code; avoids a tokenizer dependency
+_CHARS_PER_TOKEN = 4
+# Top-level and nested class declarations in a domain source file
+_CLASS_NAME_RE = re.compile(r"^\s*class\s+(\w+)", re.MULTILINE)
+
+# Bundled policy files, resolved once; also works for zipped installs
+_POLICIES_ROOT = importlib.resources.files("smartgen").joinpath("policies", "ddd")
+
+# Provider settings that live only in the global config and are merged in
+_SENSITIVE_FIELDS = frozenset({"api_key", "api_secret", "token", "password"})
+
+# LLM clients reused across calls so their HTTP connection pools are kept
+_CLIENT_CACHE: dict[tuple[str, ...], Any] = {}
+
+# Debug output longer than this skips Rich rendering entirely
+_DEBUG_PLAIN_THRESHOLD = 100_000
+# Longest text shown inside a Rich debug panel
+_DEBUG_MAX_CHARS = 10_000
+
+# Rich console shared by all debug output; created on first use
+_CONSOLE: Any = None
+# (Panel, Syntax, Text) from rich; imported on first use
+_RICH: Any = None
+# Checked once without importing rich, which stays lazy until a debug print
+_HAS_RICH = importlib.util.find_spec("rich") is not None
+
+
+@lru_cache(maxsize=32)
+def _cached_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime, size) so edits are picked up."""
+    # Imported here so yaml isn't loaded until a project config is read
+    from smartgen import _yaml
+    # The loader detects the encoding itself, so hand it the raw bytes
+    return _yaml.safe_load(Path(path).read_bytes())
+
+
+# One policy file per language, so a handful of entries is plenty
+@lru_cache(maxsize=8)
+def _cached_policy(path: str, mtime_ns: int, size: int) -> str:
+    """Read a policy file; cached per (path, mtime, size) so edits are picked up."""
+    return Path(path).read_bytes().decode("utf-8")
+
+
+@lru_cache(maxsize=1024)
+def _cached_source(path: str, mtime_ns: int, size: int) -> str:
+    """Read a domain source file; cached per (path, mtime, size).
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    return Path(path).read_bytes().decode("utf-8")
+
+
+def _cached_client(key: tuple[str, ...], factory: Callable[[], Any]) -> Any:
+    """Get a cached LLM client, creating it with factory on first use."""
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = factory()
+        _CLIENT_CACHE[key] = client
+    return client
+
+
+def _api_key_digest(api_key: str | None) -> str:
+    """Short digest identifying an API key without keeping the key itself."""
+    return hashlib.blake2b((api_key or "").encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _get_console() -> Any:
+    """Get the shared Rich console, creating it on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+def _get_rich() -> Any:
+    """Get the Rich renderables used for debug output, importing them once."""
+    global _RICH
+    if _RICH is None:
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+        from rich.text import Text
+        _RICH = (Panel, Syntax, Text)
+    return _RICH
+
+
+@cache
+def _get_lexer(name: str) -> Any:
+    """Get a Pygments lexer by name, built once per process."""
+    from pygments.lexers import get_lexer_by_name
+    return get_lexer_by_name(name)
+
+
+def _plan_prompt_budget(
+    srs_content: str,
+    domain_files_content: dict[str, str],
+    max_tokens: int = _DOMAIN_TOKEN_BUDGET,
+) -> dict[str, str]:
+    """Fit the domain files into a token budget for the prompt.
+    
+    Files whose classes the SRS mentions most are kept whole first; files
+    that no longer fit are replaced by a one-line note.
+    
+    Args:
+        srs_content: Content of the SRS
+        domain_files_content: Dictionary of domain file paths and their content
+        max_tokens: Estimated tokens the domain files may use
+        
+    Returns:
+        Dictionary with the same paths, in the same order, where elided
+        files hold a truncation note instead of their content
+    """
+    total_chars = sum(len(content) for content in domain_files_content.values())
+    if total_chars // _CHARS_PER_TOKEN <= max_tokens:
+        return domain_files_content
+    
+    srs_lower = srs_content.lower()
+    
+    def relevance(item: tuple[str, str]) -> int:
+        return sum(
+            srs_lower.count(name.lower())
+            for name in _CLASS_NAME_RE.findall(item[1])
+        )
+    
+    kept: set[str] = set()
+    remaining = max_tokens
+    # sorted() is stable, so equally relevant files keep their path order
+    for file_path, content in sorted(domain_files_content.items(), key=relevance, reverse=True):
+        tokens = len(content) // _CHARS_PER_TOKEN
+        if tokens <= remaining:
+            kept.add(file_path)
+            remaining -= tokens
+    
+    # Output keeps the input order so unchanged inputs give the same prompt
+    planned: dict[str, str] = {}
+    for file_path, content in domain_files_content.items():
+        if file_path not in kept:
+            omitted = content.count("\n") + 1
+            content = f"# <truncated: {omitted} lines omitted>"
+        planned[file_path] = content
+    return planned
+
+
 @dataclass(frozen=True)
 class LayoutGenerationResult:
     """Result of layout generation."""
@@ -37,6 +247,18 @@ class LayoutGenerationResult:
     llm_response: str
 
 
+@dataclass(frozen=True)
+class _LayoutInputs:
+    """Everything read from disk for one layout generation."""
+
+    provider_name: str
+    provider_config: dict[str, Any]
+    srs_content: str
+    policy_content: str
+    domain_files_content: dict[str, str]
+    cache_config: dict[str, Any] | None
+
+
 class LayoutGeneratorService:
     """Service for generating application layout using LLM."""
 
@@ -47,6 +269,17 @@ class LayoutGeneratorService:
             debug: Enable debug output for all steps
         """
         self._debug = debug
+        # Provider type -> handler; subclasses can register more types here
+        self._dispatch: dict[str, Callable[[dict[str, Any], str], str]] = {
+            "local": self._call_ollama,
+            "cloud": self._call_cloud_provider,
+        }
+        self._dispatch_async: dict[
+            str, Callable[[dict[str, Any], str], Awaitable[str]]
+        ] = {
+            "local": self._call_ollama_async,
+            "cloud": self._call_cloud_provider_async,
+        }
 
     def generate_layout(self, project_dir: Path) -> LayoutGenerationResult:
         """
@@ -61,6 +294,58 @@ class LayoutGeneratorService:
         Raises:
             LayoutGeneratorError: If configuration or required files are missing
         """
+        inputs = self._read_inputs(project_dir)
+        
+        # 5. Call LLM to generate layout structure
+        if self._debug:
+            self._print_debug("Calling LLM", f"Provider: {inputs.provider_name} ({inputs.provider_config.get('type')})")
+        
+        llm_response = self._call_llm(
+            provider_config=inputs.provider_config,
+            srs_content=inputs.srs_content,
+            policy_content=inputs.policy_content,
+            domain_files_content=inputs.domain_files_content,
+            cache_config=inputs.cache_config,
+        )
+        
+        return self._write_result(project_dir, inputs.provider_name, llm_response)
+
+    async def generate_layout_async(self, project_dir: Path) -> LayoutGenerationResult:
+        """
+        Generate layout structures without blocking the event loop.
+        
+        Same steps as generate_layout, but the LLM request is awaited and
+        file reads and writes run in worker threads, so several projects
+        can be generated concurrently (see generate_layouts).
+        
+        Args:
+            project_dir: The project directory containing .smartgen.yml
+            
+        Returns:
+            LayoutGenerationResult with generated files and metadata
+            
+        Raises:
+            LayoutGeneratorError: If configuration or required files are missing
+        """
+        inputs = await asyncio.to_thread(self._read_inputs, project_dir)
+        
+        if self._debug:
+            self._print_debug("Calling LLM", f"Provider: {inputs.provider_name} ({inputs.provider_config.get('type')})")
+        
+        llm_response = await self._call_llm_async(
+            provider_config=inputs.provider_config,
+            srs_content=inputs.srs_content,
+            policy_content=inputs.policy_content,
+            domain_files_content=inputs.domain_files_content,
+            cache_config=inputs.cache_config,
+        )
+        
+        return await asyncio.to_thread(
+            self._write_result, project_dir, inputs.provider_name, llm_response
+        )
+
+    def _read_inputs(self, project_dir: Path) -> _LayoutInputs:
+        """Load the configuration and read every input the prompt needs."""
         if self._debug:
             self._print_debug("Starting layout generation", f"Project directory: {project_dir}")
         
@@ -95,7 +380,7 @@ class LayoutGeneratorService:
         policy_content = self._read_policy(language)
         
         if self._debug:
-            self._print_debug("Layout Policy", policy_content[:500] + "..." if len(policy_content) > 500 else policy_content, is_text=True)
+            self._print_debug("Layout Policy", policy_content, is_text=True, preview_chars=500)
         
         # 4. Read existing domain files
         domain_files_content = self._read_domain_files(project_dir)
@@ -104,17 +389,22 @@ class LayoutGeneratorService:
             domain_summary = f"Found {len(domain_files_content)} domain file(s)"
             self._print_debug("Domain Files", domain_summary)
         
-        # 5. Call LLM to generate layout structure
-        if self._debug:
-            self._print_debug("Calling LLM", f"Provider: {default_provider} ({provider_config.get('type')})")
-        
-        llm_response = self._call_llm(
+        return _LayoutInputs(
+            provider_name=default_provider,
             provider_config=provider_config,
             srs_content=srs_content,
             policy_content=policy_content,
             domain_files_content=domain_files_content,
+            cache_config=config.get("cache"),
         )
-        
+
+    def _write_result(
+        self,
+        project_dir: Path,
+        provider_name: str,
+        llm_response: str,
+    ) -> LayoutGenerationResult:
+        """Write the files from an LLM response and build the result."""
         if self._debug:
             self._print_debug("LLM Response", llm_response, is_text=True)
         
@@ -128,7 +418,7 @@ class LayoutGeneratorService:
             self._print_debug("Files Generated", f"Created {len(generated_files)} file(s)")
         
         return LayoutGenerationResult(
-            provider_name=default_provider,
+            provider_name=provider_name,
             generated_files=generated_files,
             llm_response=llm_response,
         )
@@ -136,14 +426,17 @@ class LayoutGeneratorService:
     def _load_project_config(self, project_dir: Path) -> dict[str, Any]:
         """Load .smartgen.yml from project directory."""
         config_path = project_dir / ".smartgen.yml"
-        if not config_path.exists():
+        try:
+            st = config_path.stat()
+            config = _cached_yaml(str(config_path), st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
             raise MissingProjectConfigError(
                 f"'.smartgen.yml' not found in {project_dir}. "
                 "Run 'smartgen init' first."
-            )
+            ) from None
         
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        # Copied so callers can't mutate the cached parse
+        return copy.deepcopy(config)
     
     def _merge_with_global_config(self, provider_name: str, project_config: dict[str, Any]) -> dict[str, Any]:
         """Merge project provider config with global config to get API keys.
@@ -160,8 +453,6 @@ class LayoutGeneratorService:
         """
         from smartgen.config import ConfigManager
         
-        merged_config = dict(project_config)
-        
         # Load global config
         global_config = ConfigManager.load_config()
         global_llm = global_config.get("llm", {})
@@ -169,24 +460,26 @@ class LayoutGeneratorService:
         global_provider_config = global_providers.get(provider_name, {})
         
         # Merge sensitive fields from global config
-        sensitive_fields = ["api_key", "api_secret", "token", "password"]
-        for field in sensitive_fields:
-            if field in global_provider_config and field not in merged_config:
-                merged_config[field] = global_provider_config[field]
-        
-        return merged_config
+        extras = {
+            key: value
+            for key, value in global_provider_config.items()
+            if key in _SENSITIVE_FIELDS and key not in project_config
+        }
+        return {**project_config, **extras}
 
     def _read_srs(self, project_dir: Path) -> str:
         """Read the Software Requirements Specification."""
         srs_path = project_dir / "srs.md"
-        if not srs_path.exists():
+        try:
+            content = srs_path.read_bytes().decode("utf-8")
+        except FileNotFoundError:
             raise MissingSRSError(
                 f"'srs.md' not found in {project_dir}. "
                 "Please create the SRS file first."
-            )
+            ) from None
         
-        content = srs_path.read_text(encoding="utf-8")
-        if not content.strip():
+        # isspace() checks in place instead of building a stripped copy
+        if not content or content.isspace():
             raise MissingSRSError(
                 "srs.md is empty. Please provide requirements before generating layout."
             )
@@ -195,16 +488,18 @@ class LayoutGeneratorService:
 
     def _read_policy(self, language: str) -> str:
         """Read the layout policy file."""
-        # Get the path to the policy file relative to this module
-        policies_dir = Path(__file__).parent.parent / "policies" / "ddd" / language
-        policy_path = policies_dir / "layout.txt"
+        resource = _POLICIES_ROOT.joinpath(language, "layout.txt")
         
-        if not policy_path.exists():
+        try:
+            if isinstance(resource, Path):
+                st = resource.stat()
+                return _cached_policy(str(resource), st.st_mtime_ns, st.st_size)
+            # Resources inside an archive can't be stat'ed; read them directly
+            return resource.read_text(encoding="utf-8")
+        except FileNotFoundError:
             raise MissingPolicyError(
-                f"Policy file not found for language '{language}' at {policy_path}"
-            )
-        
-        return policy_path.read_text(encoding="utf-8")
+                f"Policy file not found for language '{language}' at {resource}"
+            ) from None
 
     def _read_domain_files(self, project_dir: Path) -> dict[str, str]:
         """Read all generated domain files from src/domain directory.
@@ -216,32 +511,63 @@ class LayoutGeneratorService:
             Dictionary mapping relative file paths to their content
         """
         domain_dir = project_dir / "src" / "domain"
-        domain_files = {}
+        domain_files: dict[str, str] = {}
         
         # If domain directory doesn't exist, return empty dict
-        if not domain_dir.exists():
+        if not domain_dir.is_dir():
             return domain_files
         
-        # Recursively read all Python files in the domain directory
-        for file_path in domain_dir.rglob("*.py"):
-            # Skip __pycache__ and other special directories
-            if "__pycache__" in file_path.parts or file_path.name.startswith("."):
-                continue
-            
+        source_paths: list[str] = []
+        
+        # Walk the domain directory with scandir, which reports entry types
+        # without a stat per entry; __pycache__ is never descended into
+        stack = [str(domain_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != "__pycache__":
+                            stack.append(entry.path)
+                        continue
+                    # Skip hidden files
+                    if entry.name.endswith(".py") and not entry.name.startswith("."):
+                        source_paths.append(entry.path)
+        
+        if not source_paths:
+            return domain_files
+        
+        # Reads are independent and release the GIL, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(source_paths))) as executor:
+            results = list(executor.map(self._read_source, source_paths))
+        
+        for path, result in zip(source_paths, results, strict=True):
             # Get relative path from project directory
-            relative_path = file_path.relative_to(project_dir)
-            
-            # Read file content
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                domain_files[str(relative_path)] = content
-            except (OSError, UnicodeDecodeError) as e:
+            relative_path = os.path.relpath(path, project_dir)
+            if isinstance(result, str):
+                domain_files[relative_path] = result
+            elif self._debug:
                 # Skip files that can't be read
-                if self._debug:
-                    self._print_debug("Warning", f"Could not read {relative_path}: {e}")
-                continue
+                self._print_debug("Warning", f"Could not read {relative_path}: {result}")
+        
+        # Sorted so the prompt, and so any cached response, doesn't depend
+        # on directory listing order
+        return dict(sorted(domain_files.items()))
+
+    @staticmethod
+    def _read_source(path: str) -> str | Exception:
+        """Read one domain source file.
         
-        return domain_files
+        Args:
+            path: File path
+            
+        Returns:
+            File content, or the error if the file couldn't be read
+        """
+        try:
+            st = os.stat(path)
+            return _cached_source(path, st.st_mtime_ns, st.st_size)
+        except (OSError, UnicodeDecodeError) as e:
+            return e
 
     def _call_llm(
         self,
@@ -249,6 +575,7 @@ class LayoutGeneratorService:
         srs_content: str,
         policy_content: str,
         domain_files_content: dict[str, str],
+        cache_config: dict[str, Any] | None = None,
     ) -> str:
         """
         Call the LLM to generate layout structures.
@@ -258,9 +585,14 @@ class LayoutGeneratorService:
             srs_content: Content of the SRS
             policy_content: Layout policy rules
             domain_files_content: Dictionary of domain file paths and their content
+            cache_config: The ``cache`` block of .smartgen.yml, if any
             
         Returns:
             LLM response containing generated code
+            
+        Raises:
+            LayoutGeneratorError: If the cache configuration is invalid
+            LLMError: If the LLM call fails
         """
         provider_type = provider_config.get("type")
         
@@ -270,57 +602,127 @@ class LayoutGeneratorService:
         if self._debug:
             self._print_debug("Prompt sent to LLM", prompt, is_text=True)
         
-        if provider_type == "local":
-            return self._call_ollama(provider_config, prompt)
-        elif provider_type == "cloud":
-            return self._call_cloud_provider(provider_config, prompt)
-        else:
+        cache, key, cached_response = self._cache_lookup(provider_config, prompt, cache_config)
+        if cached_response is not None:
+            return cached_response
+        
+        handler = self._dispatch.get(provider_type)
+        if handler is None:
+            raise LLMError(f"Unsupported provider type: {provider_type}")
+        response = handler(provider_config, prompt)
+        
+        if cache is not None:
+            # Only responses that parse into files are cached, so a refusal
+            # or truncated reply isn't replayed for the whole ttl
+            self._parse_layout_files(response)
+            cache.set(key, response, ttl=cache_ttl(cache_config))
+        return response
+
+    async def _call_llm_async(
+        self,
+        provider_config: dict[str, Any],
+        srs_content: str,
+        policy_content: str,
+        domain_files_content: dict[str, str],
+        cache_config: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Call the LLM to generate layout structures, without blocking.
+        
+        Args:
+            provider_config: LLM provider configuration
+            srs_content: Content of the SRS
+            policy_content: Layout policy rules
+            domain_files_content: Dictionary of domain file paths and their content
+            cache_config: The ``cache`` block of .smartgen.yml, if any
+            
+        Returns:
+            LLM response containing generated code
+            
+        Raises:
+            LayoutGeneratorError: If the cache configuration is invalid
+            LLMError: If the LLM call fails
+        """
+        provider_type = provider_config.get("type")
+        
+        # Build the prompt
+        prompt = self._build_prompt(srs_content, policy_content, domain_files_content)
+        
+        if self._debug:
+            self._print_debug("Prompt sent to LLM", prompt, is_text=True)
+        
+        cache, key, cached_response = self._cache_lookup(provider_config, prompt, cache_config)
+        if cached_response is not None:
+            return cached_response
+        
+        handler = self._dispatch_async.get(provider_type)
+        if handler is None:
             raise LLMError(f"Unsupported provider type: {provider_type}")
+        response = await handler(provider_config, prompt)
+        
+        if cache is not None:
+            # Only responses that parse into files are cached, so a refusal
+            # or truncated reply isn't replayed for the whole ttl
+            self._parse_layout_files(response)
+            cache.set(key, response, ttl=cache_ttl(cache_config))
+        return response
+
+    def _cache_lookup(
+        self,
+        provider_config: dict[str, Any],
+        prompt: str,
+        cache_config: dict[str, Any] | None,
+    ) -> tuple[CacheBackend | None, str, str | None]:
+        """Look up a cached response for an LLM request.
+        
+        Args:
+            provider_config: LLM provider configuration
+            prompt: Prompt that would be sent
+            cache_config: The ``cache`` block of .smartgen.yml, if any
+            
+        Returns:
+            The cache (None if caching is off), the request's cache key and
+            the cached response, if any
+            
+        Raises:
+            LayoutGeneratorError: If the cache configuration is invalid
+        """
+        try:
+            cache = cache_from_config(cache_config)
+        except ValueError as e:
+            raise LayoutGeneratorError(f"Invalid cache configuration: {e}") from e
+        
+        if cache is None:
+            return None, "", None
+        
+        key = cache_key(provider_config.get("type"), provider_config.get("model"), prompt)
+        cached_response = cache.get(key)
+        if cached_response is not None and self._debug:
+            self._print_debug("LLM cache hit", f"Key: {key}")
+        return cache, key, cached_response
 
     def _build_prompt(self, srs_content: str, policy_content: str, domain_files_content: dict[str, str]) -> str:
         """Build the prompt for the LLM."""
         # Format domain files for the prompt
+        # Joined once; repeated += would copy everything so far per file
         domain_files_section = ""
         if domain_files_content:
-            domain_files_section = "\n# Existing Domain Layer Files:\n"
+            domain_files_content = _plan_prompt_budget(srs_content, domain_files_content)
+            # Identical files (empty __init__.py modules, shared stubs) are
+            # sent once under all their paths, saving tokens on every request
+            paths_by_content: dict[str, list[str]] = {}
             for file_path, content in domain_files_content.items():
-                domain_files_section += f"\n## {file_path}\n```python\n{content}\n```\n"
+                paths_by_content.setdefault(content, []).append(file_path)
+            domain_files_section = "\n# Existing Domain Layer Files:\n" + "".join(
+                f"\n## {', '.join(file_paths)}\n```python\n{content}\n```\n"
+                for content, file_paths in paths_by_content.items()
+            )
         
-        return f"""You are a software architect specializing in layered architecture design. Based on the Software Requirements Specification (SRS), the existing Domain Layer files, and the layout policy provided, generate the structure (no implementations) for the Application, Infrastructure, and Interface layers.
-
-# Layout Policy and Guidelines:
-{policy_content}
-
-# Software Requirements Specification:
-{srs_content}
-{domain_files_section}
-# Instructions:
-1. Analyze the requirements in the SRS
-2. Review the existing domain models to understand what entities, value objects, and aggregates exist
-3. Design the Application, Infrastructure, and Interface layers that work with these domain models
-4. Organize files following the policy guidelines strictly
-5. IMPORTANT: Return the generated structure in a JSON format with file paths and content as shown below:
-
-# Output Format:
-Return a JSON object with the following structure:
-{{
-    "files": [
-        {{
-            "path": "src/application/use_cases/create_order_use_case.py",
-            "content": ""
-        }},
-        {{
-            "path": "src/infrastructure/repositories/order_repository.py",
-            "content": ""
-        }},
-        {{
-            "path": "src/interface/controllers/order_controller.py",
-            "content": ""
-        }}
-    ]
-}}
-
-Generate the application layout structure now:"""
+        return _PROMPT_TEMPLATE.format(
+            policy=policy_content,
+            srs=srs_content,
+            domain_files=domain_files_section,
+        )
 
     def _call_ollama(self, provider_config: dict[str, Any], prompt: str) -> str:
         """Call Ollama local LLM."""
@@ -335,15 +737,19 @@ Generate the application layout structure now:"""
         model = provider_config.get("model", "deepseek-coder-v2")
         
         try:
-            client = ollama.Client(host=url)
-            response = client.chat(
-                model=model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
+            client = _cached_client(("ollama", url), lambda: ollama.Client(host=url))
+            # Streamed so a long generation isn't cut off by a read timeout
+            # while the server is still producing output
+            return "".join(
+                chunk["message"]["content"] or ""
+                for chunk in client.chat(
+                    model=model,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    stream=True,
+                )
             )
-            
-            return response["message"]["content"]
         except Exception as e:
             raise LLMError(f"Failed to call Ollama: {e}") from e
 
@@ -360,38 +766,149 @@ Generate the application layout structure now:"""
         
         try:
             client_kwargs: dict[str, Any] = {"api_key": api_key}
-            base_url = provider_config.get("base_url")
             if base_url:
                 client_kwargs["base_url"] = base_url
             
-            client = openai.OpenAI(**client_kwargs)
+            client = _cached_client(
+                ("openai", _api_key_digest(api_key), base_url or ""),
+                lambda: openai.OpenAI(**client_kwargs),
+            )
             
             if is_codex:
                 # Codex models use the legacy completions API
                 if self._debug:
                     self._print_debug("Using Codex API", f"Model: {model} (legacy completions)")
                 
-                response = client.completions.create(
+                stream = client.completions.create(
                     model=model,
                     prompt=prompt,
                     max_tokens=4000,
                     temperature=0.2,
+                    stream=True,
+                )
+                return "".join(
+                    chunk.choices[0].text or ""
+                    for chunk in stream
+                    if chunk.choices
                 )
-                return response.choices[0].text or ""
             else:
                 # Modern chat models (GPT-3.5, GPT-4, etc.)
                 if self._debug:
                     self._print_debug("Using Chat API", f"Model: {model}")
                 
-                response = client.chat.completions.create(
+                request: dict[str, Any] = {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": _CHAT_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.2,
+                    "stream": True,
+                }
+                try:
+                    # JSON mode guarantees a bare JSON object, so parsing
+                    # never has to fall back to scanning the text
+                    stream = client.chat.completions.create(
+                        **request, response_format={"type": "json_object"}
+                    )
+                except openai.BadRequestError:
+                    # Older models and some compatible servers reject it
+                    stream = client.chat.completions.create(**request)
+                return "".join(
+                    chunk.choices[0].delta.content or ""
+                    for chunk in stream
+                    if chunk.choices
+                )
+        except Exception as e:
+            raise LLMError(f"Failed to call cloud provider: {e}") from e
+
+    async def _call_ollama_async(self, provider_config: dict[str, Any], prompt: str) -> str:
+        """Call Ollama local LLM without blocking the event loop."""
+        try:
+            import ollama
+        except ImportError as exc:
+            raise LLMError(
+                "ollama package not installed. Install it with: pip install ollama"
+            ) from exc
+        
+        url = provider_config.get("url", "http://localhost:11434")
+        model = provider_config.get("model", "deepseek-coder-v2")
+        
+        try:
+            # Async clients belong to the running event loop, so they are
+            # not shared through the client cache
+            client = ollama.AsyncClient(host=url)
+            try:
+                stream = await client.chat(
                     model=model,
                     messages=[
-                        {"role": "system", "content": "You are an expert software architect. Return your response as valid JSON with this structure: {\"files\": [{\"path\": \"...\", \"content\": \"...\"}]}"},
                         {"role": "user", "content": prompt}
                     ],
-                    temperature=0.2,
+                    stream=True,
                 )
-                return response.choices[0].message.content or ""
+                return "".join([
+                    chunk["message"]["content"] or "" async for chunk in stream
+                ])
+            finally:
+                await client.close()
+        except Exception as e:
+            raise LLMError(f"Failed to call Ollama: {e}") from e
+
+    async def _call_cloud_provider_async(self, provider_config: dict[str, Any], prompt: str) -> str:
+        """Call cloud LLM provider without blocking the event loop."""
+        import openai
+        
+        api_key = provider_config.get("api_key")
+        model = provider_config.get("model", "gpt-4")
+        base_url = provider_config.get("base_url")  # Support custom API endpoints
+        
+        try:
+            client_kwargs: dict[str, Any] = {"api_key": api_key}
+            if base_url:
+                client_kwargs["base_url"] = base_url
+            
+            # Async clients belong to the running event loop, so they are
+            # not shared through the client cache
+            async with openai.AsyncOpenAI(**client_kwargs) as client:
+                if self._is_codex_model(model):
+                    # Codex models use the legacy completions API
+                    if self._debug:
+                        self._print_debug("Using Codex API", f"Model: {model} (legacy completions)")
+                    
+                    stream = await client.completions.create(
+                        model=model,
+                        prompt=prompt,
+                        max_tokens=4000,
+                        temperature=0.2,
+                        stream=True,
+                    )
+                    return "".join([
+                        chunk.choices[0].text or "" async for chunk in stream if chunk.choices
+                    ])
+                
+                # Modern chat models (GPT-3.5, GPT-4, etc.)
+                if self._debug:
+                    self._print_debug("Using Chat API", f"Model: {model}")
+                
+                request: dict[str, Any] = {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": _CHAT_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.2,
+                    "stream": True,
+                }
+                try:
+                    stream = await client.chat.completions.create(
+                        **request, response_format={"type": "json_object"}
+                    )
+                except openai.BadRequestError:
+                    # Older models and some compatible servers reject JSON mode
+                    stream = await client.chat.completions.create(**request)
+                return "".join([
+                    chunk.choices[0].delta.content or "" async for chunk in stream if chunk.choices
+                ])
         except Exception as e:
             raise LLMError(f"Failed to call cloud provider: {e}") from e
     
@@ -404,13 +921,9 @@ Generate the application layout structure now:"""
         Returns:
             True if it's a Codex model
         """
-        codex_models = [
-            "code-davinci-002",
-            "code-davinci-001", 
-            "code-cushman-002",
-            "code-cushman-001",
-        ]
-        return model in codex_models or model.startswith("code-")
+        # Every Codex model name (code-davinci-002, code-cushman-001, ...)
+        # carries this prefix
+        return model.startswith("code-")
     
     def _parse_llm_json_response(self, response: str) -> dict[str, Any]:
         """Parse JSON from LLM response with robust error handling.
@@ -429,36 +942,31 @@ Generate the application layout structure now:"""
         """
         # Try to parse as-is first (if JSON mode was used)
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
+            return _json.loads(response)
+        except _json.JSONDecodeError:
             pass
         
         # Try to extract JSON from markdown code blocks
         # Handle both ```json ... ``` and ``` ... ``` formats
-        for fence in ["```json", "```"]:
-            if fence in response:
-                try:
-                    start = response.find(fence) + len(fence)
-                    end = response.find("```", start)
-                    if end > start:
-                        json_str = response[start:end].strip()
-                        return json.loads(json_str)
-                except json.JSONDecodeError:
-                    pass
-        
-        # Try to extract JSON by finding { ... }
+        match = _JSON_FENCE_RE.search(response)
+        if match:
+            try:
+                return _json.loads(match.group(1))
+            except _json.JSONDecodeError:
+                pass
+        
+        # Decode the first JSON object in the text, in place and in one pass
         json_start = response.find("{")
-        json_end = response.rfind("}")
         
-        if json_start == -1 or json_end == -1 or json_end <= json_start:
+        if json_start == -1:
             raise LLMError(
                 "No valid JSON found in LLM response. "
                 "Make sure the model is configured correctly and supports JSON output."
             )
         
         try:
-            json_str = response[json_start:json_end + 1]
-            return json.loads(json_str)
+            data, _ = _JSON_DECODER.raw_decode(response, json_start)
+            return data
         except json.JSONDecodeError as e:
             # Show a helpful error message with a snippet of the response
             snippet = response[max(0, json_start):min(len(response), json_start + 200)]
@@ -482,32 +990,91 @@ Generate the application layout structure now:"""
         Returns:
             List of generated file paths
         """
-        generated_files = []
+        files = self._parse_layout_files(llm_response)
         
-        # Parse JSON from response
-        data = self._parse_llm_json_response(llm_response)
+        # Concurrent writers to one path would interleave, so a repeated
+        # path is written once, with its last entry's content
+        contents = dict(zip(
+            (project_dir / file_info["path"] for file_info in files),
+            (file_info["content"] for file_info in files),
+            strict=True,
+        ))
+        generated_files = list(contents)
         
-        files = data.get("files", [])
-        if not files:
-            raise LLMError("No files generated by LLM")
+        # Create each target directory once, rather than once per file
+        for directory in dict.fromkeys(file_path.parent for file_path in contents):
+            directory.mkdir(parents=True, exist_ok=True)
         
-        for file_info in files:
-            file_path = project_dir / file_info["path"]
-            file_content = file_info["content"]
-            
-            # Create parent directories
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Files are independent, so write them concurrently; file I/O
+        # releases the GIL
+        with ThreadPoolExecutor(max_workers=min(32, len(contents))) as executor:
+            list(executor.map(self._write_file, contents.keys(), contents.values()))
+        
+        if self._debug:
+            for file_path in generated_files:
+                self._print_debug("Created file", os.path.relpath(file_path, project_dir))
+        
+        return generated_files
+
+    def _parse_layout_files(self, llm_response: str) -> list[dict[str, Any]]:
+        """Parse the file entries out of an LLM response.
+        
+        Args:
+            llm_response: LLM response containing generated structure
             
-            # Write file
-            file_path.write_text(file_content, encoding="utf-8")
-            generated_files.append(file_path)
+        Returns:
+            File entries, each with "path" and "content"
             
-            if self._debug:
-                self._print_debug("Created file", str(file_path.relative_to(project_dir)))
+        Raises:
+            LLMError: If the response holds no files or a malformed entry
+        """
+        data = self._parse_llm_json_response(llm_response)
         
-        return generated_files
+        files = data.get("files", []) if isinstance(data, dict) else None
+        if not files:
+            raise LLMError("No files generated by LLM")
+        if not isinstance(files, list):
+            raise LLMError("Invalid LLM response: 'files' must be a list")
+        # Check every entry before writing anything, so a malformed entry
+        # can't leave the project half-generated
+        for index, file_info in enumerate(files):
+            if not (
+                isinstance(file_info, dict)
+                and isinstance(file_info.get("path"), str)
+                and isinstance(file_info.get("content"), str)
+            ):
+                raise LLMError(
+                    f"Invalid LLM response: file entry {index} must have "
+                    "string 'path' and 'content' fields"
+                )
+        return files
+
+    @staticmethod
+    def _write_file(file_path: Path, content: str) -> None:
+        """Write one generated file; its directory must already exist.
+        
+        Args:
+            file_path: Path of the file to write
+            content: File content
+        """
+        # Raw descriptor I/O skips the buffered file object; os.write may
+        # write less than asked, so loop until everything is out
+        data = memoryview(content.encode("utf-8"))
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
     
-    def _print_debug(self, title: str, content: Any, is_yaml: bool = False, is_text: bool = False) -> None:
+    def _print_debug(
+        self,
+        title: str,
+        content: Any,
+        is_yaml: bool = False,
+        is_text: bool = False,
+        preview_chars: int | None = None,
+    ) -> None:
         """Print debug information with nice formatting.
         
         Args:
@@ -515,28 +1082,66 @@ Generate the application layout structure now:"""
             content: Content to display
             is_yaml: Format as YAML
             is_text: Format as plain text with text wrapping
+            preview_chars: Show only this many characters of text content,
+                followed by "..."
         """
-        try:
-            from rich.console import Console
-            from rich.panel import Panel
-            from rich.syntax import Syntax
-            from rich.text import Text
-            
-            console = Console()
-            
-            if is_yaml:
-                yaml_str = yaml.dump(content, default_flow_style=False, sort_keys=False)
-                syntax = Syntax(yaml_str, "yaml", theme="monokai", line_numbers=False)
-                console.print(Panel(syntax, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
-            elif is_text:
-                # Wrap long text for readability
-                text_obj = Text(str(content))
-                console.print(Panel(text_obj, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
-            else:
-                console.print(Panel(str(content), title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
-            console.print()  # Empty line for spacing
-        except ImportError:
-            # Fallback if rich is not available
-            print(f"\n=== {title} ===")
-            print(content)
-            print()
+        # Callers guard on self._debug before building their arguments;
+        # this keeps any unguarded call free when debug output is off
+        if not self._debug:
+            return
+        
+        if preview_chars is not None and isinstance(content, str) and len(content) > preview_chars:
+            content = content[:preview_chars] + "..."
+        
+        # Panels and highlighting are wasted when output is piped to a file,
+        # and rendering a huge response in a panel is slow
+        if not _HAS_RICH or not sys.stdout.isatty() or (
+            isinstance(content, str) and len(content) > _DEBUG_PLAIN_THRESHOLD
+        ):
+            print(f"\n=== {title} ===\n{content}\n")
+            return
+        
+        if isinstance(content, str) and len(content) > _DEBUG_MAX_CHARS:
+            omitted = len(content) - _DEBUG_MAX_CHARS
+            content = f"{content[:_DEBUG_MAX_CHARS]}\n... (truncated, {omitted} more characters)"
+        
+        Panel, Syntax, Text = _get_rich()
+        console = _get_console()
+        
+        if is_yaml:
+            from smartgen import _yaml
+            yaml_str = _yaml.safe_dump(content, default_flow_style=False, sort_keys=False)
+            syntax = Syntax(yaml_str, _get_lexer("yaml"), theme="monokai", line_numbers=False)
+            console.print(Panel(syntax, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
+        elif is_text:
+            # Wrap long text for readability
+            text_obj = Text(str(content))
+            console.print(Panel(text_obj, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
+        else:
+            console.print(Panel(str(content), title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
+        console.print()  # Empty line for spacing
+
+
+async def generate_layouts(
+    project_dirs: Iterable[Path],
+    debug: bool = False,
+) -> list[LayoutGenerationResult]:
+    """Generate layouts for several projects concurrently.
+    
+    The LLM requests overlap, so the total time is close to that of the
+    slowest project rather than the sum of all of them.
+    
+    Args:
+        project_dirs: Project directories, each containing .smartgen.yml
+        debug: Enable debug output for all steps
+        
+    Returns:
+        One LayoutGenerationResult per project, in the order given
+        
+    Raises:
+        LayoutGeneratorError: The first error raised by any project
+    """
+    service = LayoutGeneratorService(debug=debug)
+    return await asyncio.gather(
+        *(service.generate_layout_async(project_dir) for project_dir in project_dirs)
+    )
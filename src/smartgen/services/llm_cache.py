@@ -0,0 +1,229 @@
+"""Response caches for LLM calls.
+
+Generation requests are sent with a low temperature, so an identical
+request (same provider type, model and prompt) is answered from the cache
+instead of repeating a call that takes seconds to minutes.
+
+Caching is opt-in through a ``cache:`` block in .smartgen.yml::
+
+    cache:
+      backend: file      # "memory" (this process only) or "file"
+      ttl: 3600          # seconds a response stays valid
+      max_entries: 128   # memory backend only
+      dir: ~/.smartgen/cache  # file backend only
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+from smartgen import _json
+
+DEFAULT_TTL = 3600
+DEFAULT_MAX_ENTRIES = 128
+
+# Memory caches live for the whole process so repeated generations share them
+_MEMORY_CACHES: dict[int, MemoryCache] = {}
+
+
+class CacheBackend(Protocol):
+    """Storage for LLM responses keyed by request hash."""
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response, or None if missing or expired."""
+        ...
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store a response, optionally expiring after ttl seconds."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove a cached response if present."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU cache of LLM responses."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of responses kept before the least recently
+                used one is evicted
+        """
+        self._max_entries = max_entries
+        # key -> (monotonic expiry time or None, response)
+        self._entries: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store a response, optionally expiring after ttl seconds."""
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a cached response if present."""
+        self._entries.pop(key, None)
+
+
+class FileCache:
+    """LLM responses stored as one JSON file per request hash."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache files; created on first write
+        """
+        self._directory = directory
+
+    @property
+    def directory(self) -> Path:
+        """Get the cache directory."""
+        return self._directory
+
+    def _path(self, key: str) -> Path:
+        """Get the file holding the entry for key."""
+        return self._directory / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response, or None if missing, expired or unreadable."""
+        path = self._path(key)
+        try:
+            entry = _json.loads(path.read_bytes())
+            expires_at = entry.get("expires_at")
+            response = entry["response"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            return None
+        # Wall-clock time, since entries outlive the process
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return None
+        return response
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store a response, optionally expiring after ttl seconds."""
+        expires_at = None if ttl is None else time.time() + ttl
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        # Written to a temp file and renamed so readers never see half an entry
+        tmp_path.write_bytes(_json.dumps({"expires_at": expires_at, "response": value}))
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        """Remove a cached response if present."""
+        self._path(key).unlink(missing_ok=True)
+
+
+def cache_key(provider_type: str | None, model: str | None, prompt: str) -> str:
+    """Compute the cache key for an LLM request.
+
+    Args:
+        provider_type: Provider type ("local" or "cloud")
+        model: Model name
+        prompt: Full prompt sent to the model
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    payload = json.dumps(
+        {"type": provider_type, "model": model, "prompt": prompt},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_from_config(config: dict[str, Any] | bool | None) -> CacheBackend | None:
+    """Build the cache described by the ``cache:`` block of .smartgen.yml.
+
+    Args:
+        config: The ``cache`` block, True for the defaults, or None if the
+            project has none
+
+    Returns:
+        Cache backend, or None if caching is not enabled
+
+    Raises:
+        ValueError: If the block is not a mapping, or the backend name, ttl
+            or max_entries is invalid
+    """
+    if config is True:
+        # "cache: true" enables caching with the default settings
+        config = {}
+    elif not config:
+        return None
+    elif not isinstance(config, dict):
+        raise ValueError(
+            f"Invalid cache settings: {config!r} (expected a mapping or true)"
+        )
+    elif not config.get("enabled", True):
+        return None
+
+    # Checked here, before any LLM call, rather than when the response is stored
+    cache_ttl(config)
+
+    backend = config.get("backend", "memory")
+    if backend == "memory":
+        max_entries = config.get("max_entries", DEFAULT_MAX_ENTRIES)
+        if (
+            isinstance(max_entries, bool)
+            or not isinstance(max_entries, int)
+            or max_entries < 1
+        ):
+            raise ValueError(
+                f"Invalid cache max_entries: {max_entries!r} (expected a positive integer)"
+            )
+        cache = _MEMORY_CACHES.get(max_entries)
+        if cache is None:
+            cache = _MEMORY_CACHES[max_entries] = MemoryCache(max_entries)
+        return cache
+    if backend == "file":
+        directory = config.get("dir")
+        if directory is None:
+            from smartgen.config import ConfigManager
+
+            return FileCache(ConfigManager.CONFIG_DIR / "cache")
+        return FileCache(Path(directory).expanduser())
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+
+def cache_ttl(config: dict[str, Any] | bool | None) -> float | None:
+    """Get the response lifetime configured in the ``cache:`` block.
+
+    Args:
+        config: The ``cache`` block
+
+    Returns:
+        Seconds a cached response stays valid, or None for no expiry
+
+    Raises:
+        ValueError: If ttl is not a non-negative number of seconds
+    """
+    ttl = config.get("ttl", DEFAULT_TTL) if isinstance(config, dict) else DEFAULT_TTL
+    if ttl is None:
+        return None
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl < 0:
+        raise ValueError(f"Invalid cache ttl: {ttl!r} (expected a number of seconds)")
+    return float(ttl)
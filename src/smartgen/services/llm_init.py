@@ -4,10 +4,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Optional
-import json
-import concurrent.futures
 import time
 
+from smartgen import _json
 from smartgen.config import ConfigManager
 
 
@@ -140,7 +139,7 @@ class LLMInitService:
         Note: API keys are never written to the project file. They remain
         in the global ~/.smartgen/.llmconfig file for security.
         """
-        from yaml import safe_dump
+        from smartgen import _yaml
 
         target_dir.mkdir(parents=True, exist_ok=True)
         yaml_path = target_dir / ".smartgen.yml"
@@ -166,7 +165,7 @@ class LLMInitService:
             }
         }
 
-        yaml_content = safe_dump(
+        yaml_content = _yaml.safe_dump(
             config_payload,
             sort_keys=False,
             default_flow_style=False,
@@ -215,22 +214,18 @@ class LLMInitService:
 
     def _pull_ollama_model(self, model: str, url: str) -> str:
         """Pull the model from Ollama and return response as JSON."""
+        import httpx
+
         try:
             client = self._get_ollama_client(url)
             response = None
             if self._ollama_progress_callback:
                 response = self._pull_ollama_model_streaming(client, model)
             if response is None:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(client.pull, model)
-                    response = future.result(timeout=self.OLLAMA_PULL_TIMEOUT_SECONDS)
-        except concurrent.futures.TimeoutError as exc:
-            raise LLMInitError(
-                "Ollama pull timed out after "
-                f"{self.OLLAMA_PULL_TIMEOUT_SECONDS}s. "
-                "Ensure the Ollama server is running and reachable."
-            ) from exc
-        except TimeoutError as exc:
+                # The client is built with the pull timeout, so the blocking
+                # call can run on this thread
+                response = client.pull(model)
+        except (httpx.TimeoutException, TimeoutError) as exc:
             raise LLMInitError(
                 "Ollama pull timed out after "
                 f"{self.OLLAMA_PULL_TIMEOUT_SECONDS}s. "
@@ -246,29 +241,31 @@ class LLMInitService:
 
     def _pull_ollama_model_streaming(self, client: Any, model: str) -> Optional[Any]:
         """Stream pull progress updates when supported by the client."""
-        start_time = time.monotonic()
+        deadline_ns = time.monotonic_ns() + self.OLLAMA_PULL_TIMEOUT_SECONDS * 1_000_000_000
         try:
             response_iter = client.pull(model, stream=True)
         except TypeError:
             return None
 
+        # A large pull yields tens of thousands of updates; payloads are only
+        # converted to dicts when there is a callback to receive them
+        callback = self._ollama_progress_callback
         last_payload: Optional[Any] = None
         for payload in response_iter:
             last_payload = payload
-            normalized_payload: Optional[dict[str, Any]] = None
-            if isinstance(payload, dict):
-                normalized_payload = payload
-            elif hasattr(payload, "model_dump"):
-                normalized_payload = payload.model_dump()
-            elif hasattr(payload, "dict"):
-                normalized_payload = payload.dict()
-
-            try:
-                if normalized_payload is not None and self._ollama_progress_callback:
-                    self._ollama_progress_callback(normalized_payload)
-            except Exception:
-                pass
-            if time.monotonic() - start_time > self.OLLAMA_PULL_TIMEOUT_SECONDS:
+            if callback is not None:
+                if isinstance(payload, dict):
+                    normalized_payload: Optional[dict[str, Any]] = payload
+                else:
+                    dump = getattr(payload, "model_dump", None) or getattr(payload, "dict", None)
+                    normalized_payload = dump() if dump is not None else None
+
+                try:
+                    if normalized_payload is not None:
+                        callback(normalized_payload)
+                except Exception:
+                    pass
+            if time.monotonic_ns() > deadline_ns:
                 raise TimeoutError("Ollama pull timed out")
 
         return last_payload
@@ -278,12 +275,14 @@ class LLMInitService:
         if isinstance(response, str):
             return response
         if isinstance(response, dict):
-            return json.dumps(response, indent=2, ensure_ascii=False)
-        if hasattr(response, "model_dump"):
-            return json.dumps(response.model_dump(), indent=2, ensure_ascii=False)
-        if hasattr(response, "dict"):
-            return json.dumps(response.dict(), indent=2, ensure_ascii=False)
-        return json.dumps(str(response), indent=2, ensure_ascii=False)
+            payload = response
+        elif hasattr(response, "model_dump"):
+            payload = response.model_dump()
+        elif hasattr(response, "dict"):
+            payload = response.dict()
+        else:
+            payload = str(response)
+        return _json.dumps(payload, pretty=True).decode("utf-8")
 
     def _get_ollama_client(self, url: str) -> Any:
         """Return an Ollama client instance."""
@@ -292,4 +291,4 @@ class LLMInitService:
 
         import ollama
 
-        return ollama.Client(host=url)
+        return ollama.Client(host=url, timeout=self.OLLAMA_PULL_TIMEOUT_SECONDS)
@@ -1,16 +1,5 @@
 """Pytest configuration and fixtures."""
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
-
-
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
 
 
 @pytest.fixture
@@ -1,52 +1,111 @@
 """Tests for configuration management."""
 import pytest
-from pathlib import Path
+
 from smartgen.config import ConfigManager
 
 
+@pytest.fixture(scope="session")
+def _config_root(tmp_path_factory):
+    """Config directory shared by all ConfigManager tests."""
+    root = tmp_path_factory.mktemp("cfg")
+    (root / ".smartgen").mkdir()
+    return root
+
+
 class TestConfigManager:
     """Test cases for ConfigManager."""
     
-    def test_ensure_config_dir(self, temp_dir, monkeypatch):
+    @pytest.fixture
+    def config_file(self, _config_root):
+        """Config file in the shared config directory, removed beforehand."""
+        config_file = _config_root / ".smartgen" / ".llmconfig"
+        config_file.unlink(missing_ok=True)
+        return config_file
+    
+    @pytest.fixture(autouse=True)
+    def _reset_config_state(self, monkeypatch):
+        """Reset ConfigManager's process-wide settings and caches."""
+        # Durability is only tested where asked for; skip fsync everywhere else
+        monkeypatch.setattr(ConfigManager, "DURABILITY", "none")
+        monkeypatch.delenv("SMARTGEN_FSYNC_CONFIG", raising=False)
+        # Start every test with nothing cached from a previous one
+        monkeypatch.setattr(ConfigManager, "_cache", None)
+        monkeypatch.setattr(ConfigManager, "_cache_key", None)
+        monkeypatch.setattr(ConfigManager, "_ensured_dir", None)
+    
+    def test_ensure_config_dir(self, tmp_path):
         """Test that config directory is created."""
-        monkeypatch.setattr(ConfigManager, "CONFIG_DIR", temp_dir / ".smartgen")
-        monkeypatch.setattr(ConfigManager, "CONFIG_FILE", temp_dir / ".smartgen" / ".llmconfig")
-        
-        config_dir = ConfigManager.ensure_config_dir()
+        # The shared directory already exists, so use a fresh one
+        config_dir = ConfigManager.ensure_config_dir(tmp_path / ".smartgen" / ".llmconfig")
         assert config_dir.exists()
         assert config_dir.is_dir()
     
-    def test_load_config_nonexistent(self, temp_dir, monkeypatch):
+    def test_load_config_nonexistent(self, config_file):
         """Test loading config when file doesn't exist."""
-        monkeypatch.setattr(ConfigManager, "CONFIG_DIR", temp_dir / ".smartgen")
-        monkeypatch.setattr(ConfigManager, "CONFIG_FILE", temp_dir / ".smartgen" / ".llmconfig")
-        
-        config = ConfigManager.load_config()
+        config = ConfigManager.load_config(config_file)
         assert config == {}
     
-    def test_save_and_load_config(self, temp_dir, monkeypatch):
+    def test_save_and_load_config(self, config_file):
         """Test saving and loading config."""
-        monkeypatch.setattr(ConfigManager, "CONFIG_DIR", temp_dir / ".smartgen")
-        monkeypatch.setattr(ConfigManager, "CONFIG_FILE", temp_dir / ".smartgen" / ".llmconfig")
-        
         test_config = {"llm": {"default": "test"}}
-        ConfigManager.save_config(test_config)
+        ConfigManager.save_config(test_config, config_file)
         
-        loaded_config = ConfigManager.load_config()
+        loaded_config = ConfigManager.load_config(config_file)
         assert loaded_config == test_config
+        # Saved atomically via a temp file that is renamed into place
+        assert list(config_file.parent.iterdir()) == [config_file]
     
-    def test_add_provider(self, temp_dir, monkeypatch):
-        """Test adding a provider."""
-        monkeypatch.setattr(ConfigManager, "CONFIG_DIR", temp_dir / ".smartgen")
-        monkeypatch.setattr(ConfigManager, "CONFIG_FILE", temp_dir / ".smartgen" / ".llmconfig")
+    def test_save_config_writes_once(self, config_file, monkeypatch):
+        """Test that the whole file is serialized before a single write."""
+        writes = []
+        
+        class CountingFile:
+            def __init__(self, f):
+                self._f = f
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc_info):
+                return self._f.__exit__(*exc_info)
+            
+            def __getattr__(self, name):
+                return getattr(self._f, name)
+            
+            def write(self, data):
+                writes.append(data)
+                return self._f.write(data)
+        
+        monkeypatch.setattr(
+            "smartgen.config.open",
+            lambda *args, **kwargs: CountingFile(open(*args, **kwargs)),
+            raising=False,
+        )
         
-        ConfigManager.add_provider(
+        ConfigManager.save_config({"llm": {"default": "test", "providers": {}}}, config_file)
+        assert len(writes) == 1
+    
+    def test_save_fsyncs_when_configured(self, config_file, monkeypatch):
+        """Test that DURABILITY = "fsync" flushes the file to disk."""
+        fsynced = []
+        monkeypatch.setattr("smartgen.config.os.fsync", fsynced.append)
+        
+        ConfigManager.save_config({"llm": {"default": "test"}}, config_file)
+        assert fsynced == []
+        
+        monkeypatch.setattr(ConfigManager, "DURABILITY", "fsync")
+        ConfigManager.save_config({"llm": {"default": "test"}}, config_file)
+        assert len(fsynced) == 1
+    
+    def test_add_provider(self, config_file):
+        """Test adding a provider."""
+        config = ConfigManager.add_provider(
             name="test_provider",
             provider_type="local",
-            model="test-model"
+            model="test-model",
+            config_file=config_file,
         )
         
-        config = ConfigManager.load_config()
         assert "llm" in config
         assert "providers" in config["llm"]
         assert "test_provider" in config["llm"]["providers"]
@@ -55,49 +114,106 @@ class TestConfigManager:
         # First provider should be auto-set as default
         assert config["llm"]["default"] == "test_provider"
     
-    def test_set_default_provider(self, temp_dir, monkeypatch):
-        """Test setting default provider."""
-        monkeypatch.setattr(ConfigManager, "CONFIG_DIR", temp_dir / ".smartgen")
-        monkeypatch.setattr(ConfigManager, "CONFIG_FILE", temp_dir / ".smartgen" / ".llmconfig")
+    @pytest.mark.parametrize("provider, error", [
+        ("provider2", None),
+        ("nonexistent", ValueError),
+    ])
+    def test_set_default_provider(self, config_file, provider, error):
+        """Test setting the default provider, which must exist."""
+        with ConfigManager.batch():
+            ConfigManager.add_provider("provider1", "local", model="model1", config_file=config_file)
+            ConfigManager.add_provider("provider2", "local", model="model2", config_file=config_file)
+        
+        if error:
+            with pytest.raises(error, match="not found"):
+                ConfigManager.set_default_provider(provider, config_file=config_file)
+            assert ConfigManager.load_config(config_file)["llm"]["default"] == "provider1"
+        else:
+            config = ConfigManager.set_default_provider(provider, config_file=config_file)
+            assert config["llm"]["default"] == provider
+    
+    @pytest.mark.parametrize("provider, expected_default", [
+        ("provider2", "provider1"),  # Default unchanged
+        ("provider1", None),  # Default should be unset
+    ])
+    def test_remove_provider(self, config_file, provider, expected_default):
+        """Test removing a provider, including the default one."""
+        with ConfigManager.batch():
+            ConfigManager.add_provider("provider1", "local", model="model1", config_file=config_file)
+            ConfigManager.add_provider("provider2", "local", model="model2", config_file=config_file)
+            ConfigManager.set_default_provider("provider1", config_file=config_file)
+        
+        config = ConfigManager.remove_provider(provider, config_file=config_file)
         
-        ConfigManager.add_provider("provider1", "local", model="model1")
-        ConfigManager.add_provider("provider2", "local", model="model2")
-        ConfigManager.set_default_provider("provider2")
+        assert provider not in config["llm"]["providers"]
+        assert config["llm"].get("default") == expected_default
+    
+    def test_batch_writes_once_on_exit(self, config_file):
+        """Test that changes inside batch() are written together at the end."""
+        with ConfigManager.batch():
+            ConfigManager.add_provider("provider1", "local", model="model1", config_file=config_file)
+            ConfigManager.add_provider("provider2", "local", model="model2", config_file=config_file)
+            
+            # Loads inside the block see the pending changes
+            assert set(ConfigManager.load_config(config_file)["llm"]["providers"]) == {"provider1", "provider2"}
+            assert not config_file.exists()
         
-        config = ConfigManager.load_config()
-        assert config["llm"]["default"] == "provider2"
+        config = ConfigManager.load_config(config_file)
+        assert set(config["llm"]["providers"]) == {"provider1", "provider2"}
     
-    def test_set_default_provider_nonexistent(self, temp_dir, monkeypatch):
-        """Test setting default provider that doesn't exist."""
-        monkeypatch.setattr(ConfigManager, "CONFIG_DIR", temp_dir / ".smartgen")
-        monkeypatch.setattr(ConfigManager, "CONFIG_FILE", temp_dir / ".smartgen" / ".llmconfig")
+    def test_batch_discards_changes_on_error(self, config_file):
+        """Test that a failing batch() block writes nothing."""
+        with pytest.raises(ValueError):
+            with ConfigManager.batch():
+                ConfigManager.add_provider("provider1", "local", config_file=config_file)
+                ConfigManager.set_default_provider("nonexistent", config_file=config_file)
         
-        with pytest.raises(ValueError, match="not found"):
-            ConfigManager.set_default_provider("nonexistent")
+        assert ConfigManager.load_config(config_file) == {}
     
-    def test_remove_provider(self, temp_dir, monkeypatch):
-        """Test removing a provider."""
-        monkeypatch.setattr(ConfigManager, "CONFIG_DIR", temp_dir / ".smartgen")
-        monkeypatch.setattr(ConfigManager, "CONFIG_FILE", temp_dir / ".smartgen" / ".llmconfig")
+    def test_failed_inner_batch_is_rolled_back(self, config_file):
+        """Test that a caught error in a nested batch() drops only its changes."""
+        with ConfigManager.batch():
+            ConfigManager.add_provider("provider1", "local", config_file=config_file)
+            with pytest.raises(ValueError):
+                with ConfigManager.batch():
+                    ConfigManager.add_provider("provider2", "local", config_file=config_file)
+                    raise ValueError("inner failure")
         
-        ConfigManager.add_provider("provider1", "local", model="model1")
-        ConfigManager.add_provider("provider2", "local", model="model2")
-        ConfigManager.set_default_provider("provider1")
+        config = ConfigManager.load_config(config_file)
+        assert set(config["llm"]["providers"]) == {"provider1"}
+    
+    def test_load_config_returns_independent_copies(self, config_file):
+        """Test that mutating a loaded config does not affect the cache."""
+        ConfigManager.save_config({"llm": {"default": "test"}}, config_file)
         
-        ConfigManager.remove_provider("provider2")
+        config = ConfigManager.load_config(config_file)
+        config["llm"]["default"] = "changed"
         
-        config = ConfigManager.load_config()
-        assert "provider2" not in config["llm"]["providers"]
-        assert config["llm"]["default"] == "provider1"  # Default unchanged
+        assert ConfigManager.load_config(config_file) == {"llm": {"default": "test"}}
     
-    def test_remove_default_provider(self, temp_dir, monkeypatch):
-        """Test removing the default provider."""
-        monkeypatch.setattr(ConfigManager, "CONFIG_DIR", temp_dir / ".smartgen")
-        monkeypatch.setattr(ConfigManager, "CONFIG_FILE", temp_dir / ".smartgen" / ".llmconfig")
+    def test_load_config_sees_external_changes(self, config_file):
+        """Test that the cache is invalidated when the file changes on disk."""
+        ConfigManager.save_config({"llm": {"default": "test"}}, config_file)
+        assert ConfigManager.load_config(config_file)["llm"]["default"] == "test"
+        
+        config_file.write_text('{"llm": {"default": "external"}}')
         
-        ConfigManager.add_provider("provider1", "local", model="model1")
-        ConfigManager.remove_provider("provider1")
+        assert ConfigManager.load_config(config_file)["llm"]["default"] == "external"
+    
+    def test_add_provider_preserves_unknown_keys(self, config_file):
+        """Test that keys not modelled by ConfigManager survive an update."""
+        ConfigManager.save_config({
+            "theme": "dark",
+            "llm": {
+                "default": "provider1",
+                "timeout": 30,
+                "providers": {"provider1": {"type": "cloud", "org": "acme"}},
+            },
+        }, config_file)
+        ConfigManager.add_provider("provider2", "local", config_file=config_file)
         
-        config = ConfigManager.load_config()
-        assert "provider1" not in config["llm"]["providers"]
-        assert "default" not in config["llm"]  # Default should be unset
+        config = ConfigManager.load_config(config_file)
+        assert config["theme"] == "dark"
+        assert config["llm"]["timeout"] == 30
+        assert config["llm"]["providers"]["provider1"] == {"type": "cloud", "org": "acme"}
+        assert config["llm"]["default"] == "provider1"
@@ -0,0 +1,157 @@
+"""Tests for layout generation prompt building and batch generation."""
+import asyncio
+import json
+
+import pytest
+
+from smartgen.config import ConfigManager
+from smartgen.services.layout_generator import (
+    LayoutGeneratorService,
+    LLMError,
+    _plan_prompt_budget,
+    generate_layouts,
+)
+
+
+class TestPlanPromptBudget:
+    """Test cases for fitting domain files into the prompt budget."""
+
+    def test_files_within_budget_are_unchanged(self):
+        """Test that nothing is elided when every file fits."""
+        files = {"a.py": "class Order:\n    pass", "b.py": "class User:\n    pass"}
+        assert _plan_prompt_budget("Orders", files) is files
+
+    def test_files_mentioned_in_srs_are_kept_first(self):
+        """Test that the files the SRS refers to most survive elision."""
+        files = {
+            "order.py": "class Order:\n" + "o" * 400,
+            "user.py": "class User:\n" + "u" * 400,
+            "cart.py": "class Cart:\n" + "c" * 40,
+        }
+
+        planned = _plan_prompt_budget("A User has a user profile", files, max_tokens=120)
+
+        assert planned["user.py"] == files["user.py"]
+        assert planned["cart.py"] == files["cart.py"]
+        assert planned["order.py"] == "# <truncated: 2 lines omitted>"
+
+    def test_output_keeps_input_order(self):
+        """Test that elision never reorders files, so prompts stay stable."""
+        files = {
+            "alpha.py": "class Alpha:\n" + "a" * 400,
+            "beta.py": "class Beta:\n" + "b" * 400,
+            "gamma.py": "class Gamma:\n" + "c" * 400,
+        }
+
+        planned = _plan_prompt_budget("Gamma, Gamma and Beta", files, max_tokens=210)
+
+        assert list(planned) == ["alpha.py", "beta.py", "gamma.py"]
+        assert planned["alpha.py"].startswith("# <truncated")
+        assert planned["gamma.py"] == files["gamma.py"]
+
+
+class TestBuildPrompt:
+    """Test cases for the domain files section of the layout prompt."""
+
+    def test_identical_files_are_sent_once(self):
+        """Test that duplicate contents share one block listing every path."""
+        prompt = LayoutGeneratorService()._build_prompt("SRS", "Policy", {
+            "a/__init__.py": "",
+            "b.py": "x = 1",
+            "c/__init__.py": "",
+        })
+
+        assert "\n## a/__init__.py, c/__init__.py\n```python\n\n```\n" in prompt
+        assert prompt.count("```python") == 2
+
+    def test_blocks_follow_first_occurrence_order(self):
+        """Test that grouped blocks keep the order files were read in."""
+        prompt = LayoutGeneratorService()._build_prompt("SRS", "Policy", {
+            "b.py": "x = 1",
+            "a/__init__.py": "",
+            "c/__init__.py": "",
+        })
+
+        assert prompt.index("## b.py") < prompt.index("## a/__init__.py, c/__init__.py")
+
+
+class TestWriteLayoutFiles:
+    """Test cases for writing the generated layout files."""
+
+    def test_repeated_path_is_written_once(self, tmp_path):
+        """Test that the last entry for a path wins and is returned once."""
+        response = json.dumps({"files": [
+            {"path": "app.py", "content": "first"},
+            {"path": "main.py", "content": ""},
+            {"path": "app.py", "content": "last"},
+        ]})
+
+        generated = LayoutGeneratorService()._write_layout_files(tmp_path, response)
+
+        assert generated == [tmp_path / "app.py", tmp_path / "main.py"]
+        assert (tmp_path / "app.py").read_text() == "last"
+
+
+class TestResponseCache:
+    """Test cases for caching layout responses."""
+
+    def test_unparseable_response_is_not_cached(self, tmp_path, monkeypatch):
+        """Test that a refusal is not replayed on the next run."""
+        responses = [
+            "Sorry, I cannot do that",
+            json.dumps({"files": [{"path": "a.py", "content": "x"}]}),
+        ]
+        calls = []
+
+        def fake_ollama(self, provider_config, prompt):
+            calls.append(prompt)
+            return responses[len(calls) - 1]
+
+        monkeypatch.setattr(LayoutGeneratorService, "_call_ollama", fake_ollama)
+        service = LayoutGeneratorService()
+        cache_config = {"backend": "file", "dir": str(tmp_path)}
+
+        def call():
+            return service._call_llm(
+                {"type": "local", "model": "m"}, "SRS", "Policy", {},
+                cache_config=cache_config,
+            )
+
+        with pytest.raises(LLMError):
+            call()
+        first = call()
+
+        # Third run is served from the cache without calling the model
+        assert call() == first
+        assert len(calls) == 2
+
+
+class TestGenerateLayouts:
+    """Test cases for generating several projects concurrently."""
+
+    def test_results_follow_project_order(self, tmp_path, monkeypatch, sample_smartgen_config):
+        """Test that results match the given order, not completion order."""
+        monkeypatch.setattr(ConfigManager, "CONFIG_DIR", tmp_path / ".smartgen")
+        monkeypatch.setattr(ConfigManager, "CONFIG_FILE", tmp_path / ".smartgen" / ".llmconfig")
+
+        project_dirs = []
+        for name in ("slow", "fast"):
+            project_dir = tmp_path / name
+            project_dir.mkdir()
+            (project_dir / ".smartgen.yml").write_text(sample_smartgen_config)
+            (project_dir / "srs.md").write_text(f"# {name}\n")
+            project_dirs.append(project_dir)
+
+        async def fake_ollama(self, provider_config, prompt):
+            name = "slow" if "# slow" in prompt else "fast"
+            await asyncio.sleep(0.05 if name == "slow" else 0)
+            return json.dumps({"files": [{"path": f"{name}.py", "content": ""}]})
+
+        monkeypatch.setattr(LayoutGeneratorService, "_call_ollama_async", fake_ollama)
+
+        results = asyncio.run(generate_layouts(project_dirs))
+
+        assert [result.generated_files for result in results] == [
+            [tmp_path / "slow" / "slow.py"],
+            [tmp_path / "fast" / "fast.py"],
+        ]
@@ -0,0 +1,134 @@
+"""Tests for LLM response caching."""
+import pytest
+
+from smartgen.services.llm_cache import (
+    FileCache,
+    MemoryCache,
+    cache_from_config,
+    cache_key,
+    cache_ttl,
+)
+
+
+class TestMemoryCache:
+    """Test cases for MemoryCache."""
+
+    def test_get_and_set(self):
+        """Test storing and retrieving a response."""
+        cache = MemoryCache()
+        assert cache.get("key") is None
+
+        cache.set("key", "response")
+        assert cache.get("key") == "response"
+
+        cache.delete("key")
+        assert cache.get("key") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_expired_entry_is_missing(self):
+        """Test that entries past their ttl are not returned."""
+        cache = MemoryCache()
+        cache.set("key", "response", ttl=0)
+        assert cache.get("key") is None
+
+
+class TestFileCache:
+    """Test cases for FileCache."""
+
+    def test_get_and_set(self, tmp_path):
+        """Test that responses persist across cache instances."""
+        FileCache(tmp_path / "cache").set("key", "response", ttl=60)
+
+        cache = FileCache(tmp_path / "cache")
+        assert cache.get("key") == "response"
+
+        cache.delete("key")
+        assert cache.get("key") is None
+
+    def test_expired_entry_is_removed(self, tmp_path):
+        """Test that expired entries are deleted on read."""
+        cache = FileCache(tmp_path / "cache")
+        cache.set("key", "response", ttl=0)
+
+        assert cache.get("key") is None
+        assert list((tmp_path / "cache").iterdir()) == []
+
+    def test_corrupt_entry_is_missing(self, tmp_path):
+        """Test that an unreadable cache file is treated as a miss."""
+        cache = FileCache(tmp_path)
+        (tmp_path / "key.json").write_text("not json")
+        assert cache.get("key") is None
+
+
+class TestCacheConfig:
+    """Test cases for building caches from .smartgen.yml."""
+
+    def test_disabled_without_cache_block(self):
+        """Test that caching is off unless configured."""
+        assert cache_from_config(None) is None
+        assert cache_from_config({"backend": "memory", "enabled": False}) is None
+
+    def test_memory_backend_is_shared(self):
+        """Test that the memory cache outlives a single generation."""
+        first = cache_from_config({"backend": "memory"})
+        assert isinstance(first, MemoryCache)
+        assert cache_from_config({"backend": "memory"}) is first
+
+    def test_file_backend(self, tmp_path):
+        """Test building a file cache in a configured directory."""
+        cache = cache_from_config({"backend": "file", "dir": str(tmp_path)})
+        assert isinstance(cache, FileCache)
+        assert cache.directory == tmp_path
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError, match="Unknown cache backend"):
+            cache_from_config({"backend": "redis"})
+
+    @pytest.mark.parametrize("config, match", [
+        ({"ttl": "1h"}, "ttl"),
+        ({"ttl": -1}, "ttl"),
+        ({"backend": "file", "ttl": "1h"}, "ttl"),
+        ({"max_entries": 0}, "max_entries"),
+        ({"max_entries": "many"}, "max_entries"),
+    ])
+    def test_invalid_settings(self, config, match):
+        """Test that bad settings are rejected when the cache is built."""
+        with pytest.raises(ValueError, match=match):
+            cache_from_config(config)
+
+    def test_true_enables_defaults(self):
+        """Test that ``cache: true`` builds the default memory cache."""
+        assert isinstance(cache_from_config(True), MemoryCache)
+        assert cache_ttl(True) == 3600
+
+    @pytest.mark.parametrize("config", ["yes", 1, ["memory"]])
+    def test_non_mapping_is_rejected(self, config):
+        """Test that a cache block that is not a mapping is rejected."""
+        with pytest.raises(ValueError, match="Invalid cache settings"):
+            cache_from_config(config)
+
+    def test_ttl(self):
+        """Test the configured and default response lifetime."""
+        assert cache_ttl({"ttl": 60}) == 60
+        assert cache_ttl({"ttl": None}) is None
+        assert cache_ttl({}) == 3600
+
+    def test_cache_key_depends_on_request(self):
+        """Test that keys differ whenever the request differs."""
+        key = cache_key("cloud", "gpt-4", "prompt")
+        assert key == cache_key("cloud", "gpt-4", "prompt")
+        assert key != cache_key("local", "gpt-4", "prompt")
+        assert key != cache_key("cloud", "gpt-3.5", "prompt")
+        assert key != cache_key("cloud", "gpt-4", "other prompt")